@@ -23,10 +23,17 @@ def main():
     try:
         # Import the app module
         from src.ui.app import ScriptExplorer
+        from src.utils.script_metadata import load_metadata_cache, save_metadata_cache
+        
+        # Reuse script metadata parsed in earlier sessions
+        load_metadata_cache()
         
         # Create and run the application
         app = ScriptExplorer()
-        app.mainloop()
+        try:
+            app.mainloop()
+        finally:
+            save_metadata_cache()
     except Exception as e:
         error_msg = f"Error starting application: {str(e)}\n{traceback.format_exc()}"
         print(error_msg)
@@ -19,30 +19,39 @@ class CategoryController:
     def check_and_create_directories(self, base_dir, categories):
         """Check if directories exist and create them if needed"""
         try:
-            if not os.path.exists(base_dir):
+            # One listing of the base directory answers the existence check for
+            # every category instead of a separate stat per category. Names are
+            # compared with normcase, like os.path.exists on a case-insensitive
+            # file system, and any entry counts as existing, as it did there.
+            try:
+                with os.scandir(base_dir) as entries:
+                    existing_names = {os.path.normcase(entry.name) for entry in entries}
+                print(f"Base directory already exists: {base_dir}")
+            except FileNotFoundError:
                 print(f"Base directory does not exist. Creating: {base_dir}")
                 os.makedirs(base_dir, exist_ok=True)
+                existing_names = set()
                 print(f"Created base directory: {base_dir}")
                 MessageHandler.info(f"Created base directory: {base_dir}")
-            else:
-                print(f"Base directory already exists: {base_dir}")
                 
-            missing_dirs = []
-            for category in categories:
-                category_dir = os.path.join(base_dir, category)
-                if not os.path.exists(category_dir):
-                    missing_dirs.append(category)
+            missing_dirs = [category for category in categories
+                            if os.path.normcase(category) not in existing_names]
                     
             if missing_dirs:
                 print(f"Creating {len(missing_dirs)} missing directories...")
-                for category in missing_dirs:
-                    category_dir = os.path.join(base_dir, category)
-                    try:
-                        os.makedirs(category_dir, exist_ok=True)
-                        print(f"Created directory: {category_dir}")
-                    except Exception as e:
-                        error_msg = f"Error creating {category_dir}: {str(e)}"
-                        MessageHandler.error(error_msg, "Directory Creation Error")
+                # Report every failure in one dialog rather than one per directory
+                with MessageHandler.batch(self.parent, "Directory Creation Errors"):
+                    for category in missing_dirs:
+                        category_dir = os.path.join(base_dir, category)
+                        try:
+                            os.mkdir(category_dir)
+                            print(f"Created directory: {category_dir}")
+                        except FileExistsError:
+                            # Already present, e.g. created since the listing
+                            pass
+                        except Exception as e:
+                            error_msg = f"Error creating {category_dir}: {str(e)}"
+                            MessageHandler.error(error_msg, "Directory Creation Error")
                         
                 MessageHandler.info(f"Created {len(missing_dirs)} missing directories: {', '.join(missing_dirs)}")
             else:
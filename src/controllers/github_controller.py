@@ -5,9 +5,6 @@ Handles GitHub integration for downloading scripts
 """
 
 import os
-import tkinter as tk
-from tkinter import messagebox
-from src.utils.github_downloader.github_downloader import GitHubDownloader
 from src.utils.message_handler import MessageHandler
 
 
@@ -19,6 +16,9 @@ class GitHubController:
     def show_download_dialog(self):
         """Open the GitHub download dialog"""
         try:
+            # Import lazily so the downloader is only loaded when it is needed
+            from src.utils.github_downloader.github_downloader import GitHubDownloader
+            
             # Initialize the GitHub downloader
             downloader = GitHubDownloader(self.parent, self.base_dir)
             
@@ -6,15 +6,45 @@ Handles script operations (run, edit, delete, etc.)
 
 import os
 import sys
+import codecs
 import subprocess
 import threading
 import tkinter as tk
 from tkinter import messagebox, filedialog
 
-from src.utils.script_metadata import parse_script_metadata
 from src.utils.message_handler import MessageHandler
 
 
+def _print_process_output(process):
+    """
+    Print a process's output until it exits
+    
+    The pipe is read in blocks of up to 64 KiB as they arrive instead of one
+    line at a time, and each block's complete lines are printed together.
+    
+    Args:
+        process: A subprocess.Popen started with stdout=PIPE and text=True
+        
+    Returns:
+        int: The process's return code
+    """
+    decoder = codecs.getincrementaldecoder(process.stdout.encoding or 'utf-8')(errors='replace')
+    pending = ""
+    while True:
+        chunk = process.stdout.buffer.read1(1<<16)
+        if not chunk:
+            break
+        lines = (pending + decoder.decode(chunk)).split('\n')
+        pending = lines.pop()
+        if lines:
+            print('\n'.join(line.strip() for line in lines))
+    
+    pending += decoder.decode(b'', final=True)
+    if pending:
+        print(pending.strip())
+    return process.wait()
+
+
 class ScriptController:
     def __init__(self, parent=None):
         self.parent = parent
@@ -59,13 +89,7 @@ class ScriptController:
         def read_output():
             try:
                 print(f"\n=== {action_type}: {script_name} ===\n")
-                while True:
-                    output = process.stdout.readline()
-                    if output == '' and process.poll() is not None:
-                        break
-                    if output:
-                        print(output.strip())
-                return_code = process.poll()
+                return_code = _print_process_output(process)
                 if return_code == 0:
                     print(f"\n=== Script {action_type.lower()} completed successfully: {script_name} ===\n")
                 else:
@@ -234,14 +258,7 @@ class ScriptController:
     def capture_command_output(self, process, command):
         """Capture and display command output"""
         try:
-            while True:
-                output = process.stdout.readline()
-                if output == '' and process.poll() is not None:
-                    break
-                if output:
-                    print(output.strip())
-                    
-            return_code = process.poll()
+            return_code = _print_process_output(process)
             if return_code == 0:
                 print(f"\n=== Command completed successfully ===\n")
             else:
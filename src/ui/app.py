@@ -20,7 +20,7 @@ from src.controllers import (
     ScriptController, CategoryController, GitHubController
 )
 from src.utils.admin_utils import is_admin, request_admin_elevation
-from src.utils.script_metadata import parse_script_metadata
+from src.utils.script_metadata import parse_metadata_batch, list_script_files
 from src.utils.message_handler import MessageHandler
 from src.utils.github_auth import GitHubAuthHandler
 from src.utils.rating_system import RatingSystem
@@ -60,9 +60,6 @@ class ScriptExplorer(tk.Tk):
             "Default Apps"
         ]
         
-        # Define script file extensions
-        self.script_extensions = ['.ps1', '.py', '.bat', '.cmd', '.exe']
-        
         # Setup base directory
         try:
             try:
@@ -180,8 +177,7 @@ class ScriptExplorer(tk.Tk):
                     
                     # Reset the rating system's cache
                     if self.rating_system:
-                        self.rating_system.ratings_cache = {}
-                        self.rating_system.ratings_cache_time = {}
+                        self.rating_system.clear_cache()
                     
                     MessageHandler.info(
                         "Ratings cache cleared successfully!\n"
@@ -354,48 +350,40 @@ class ScriptExplorer(tk.Tk):
         
         # Search across all categories
         found_scripts = []
+        script_files = []
         
         for category in self.categories:
             category_path = os.path.join(self.base_dir, category)
-            if not os.path.exists(category_path):
+            try:
+                script_files.extend(list_script_files(category_path))
+            except FileNotFoundError:
                 continue
+        
+        # Parse all scripts concurrently
+        all_metadata = parse_metadata_batch([file_path for _, file_path in script_files])
+        for (script_type, file_path), metadata in zip(script_files, all_metadata):
+            friendly_name, description, undoable, undo_desc, developer, link = metadata
+            
+            # Check if search text matches any field
+            if (search_text in friendly_name.lower() or 
+                search_text in description.lower() or 
+                search_text in developer.lower()):
                 
-            for file in os.listdir(category_path):
-                file_path = os.path.join(category_path, file)
-                if os.path.isfile(file_path):
-                    _, ext = os.path.splitext(file)
-                    if ext.lower() in self.script_extensions:
-                        script_type = ext.lstrip(".").upper()
-                        friendly_name, description, undoable, undo_desc, developer, link = parse_script_metadata(file_path)
-                        
-                        # Get rating if rating system is available
-                        rating_text = ""
-                        rating_value = None
-                        if self.rating_system:
-                            avg_rating = self.rating_system.get_average_rating(file_path, friendly_name)
-                            if avg_rating:
-                                rating_text = f"{avg_rating}/5"
-                                rating_value = avg_rating
-                        
-                        # Check if search text matches any field
-                        if (search_text in friendly_name.lower() or 
-                            search_text in description.lower() or 
-                            search_text in developer.lower()):
-                            
-                            found_scripts.append((
-                                script_type, 
-                                friendly_name, 
-                                developer, 
-                                description, 
-                                rating_text,  # Add rating
-                                "Yes" if undoable else "No", 
-                                undo_desc, 
-                                file_path,
-                                link,
-                                rating_value  # Add rating value for sorting
-                            ))
+                found_scripts.append((
+                    script_type, 
+                    friendly_name, 
+                    developer, 
+                    description, 
+                    "",  # Rating text, filled in by load_ratings
+                    "Yes" if undoable else "No", 
+                    undo_desc, 
+                    file_path,
+                    link,
+                    None  # Rating value for sorting, filled in by load_ratings
+                ))
         
         # Update tree with results
+        rating_keys = {}
         for script_type, friendly_name, developer, description, rating_text, undoable, undo_desc, script_path, link, rating_value in sorted(found_scripts, key=lambda x: x[1].lower()):
             # Add link to tags if available
             tags = [script_path, undo_desc]
@@ -408,13 +396,17 @@ class ScriptExplorer(tk.Tk):
                 tags.append(f"rating_{rating_value}")
                 tags.append("has_rating")
                 
-            self.script_view.scripts_tree.insert("", tk.END, 
+            item = self.script_view.scripts_tree.insert("", tk.END, 
                 values=(script_type, friendly_name, developer, description, rating_text, undoable), 
                 tags=tags
             )
+            rating_keys[item] = (script_path, friendly_name)
         
         self.script_view.scripts_label.config(text=f"Search Results: {len(found_scripts)} scripts")
         print(f"Found {len(found_scripts)} scripts matching '{search_text}'")
+        
+        # Fill in ratings in the background instead of blocking the search on GitHub
+        self.script_view.load_ratings(rating_keys)
 
     # Event Handlers
     def on_category_select(self, event):
@@ -571,9 +563,10 @@ class ScriptExplorer(tk.Tk):
         else:
             if self.github_auth.authenticate():
                 # Check if authentication was successful
-                if self.github_auth.is_authenticated():
+                status = self.github_auth.get_status()
+                if status['authenticated']:
                     MessageHandler.info(
-                        f"Successfully authenticated as {self.github_auth.user_info['login']}",
+                        f"Successfully authenticated as {status['username']}",
                         "Authentication Successful",
                         console_only=False
                     )
@@ -591,8 +584,9 @@ class ScriptExplorer(tk.Tk):
     def update_github_auth_status(self):
         """Update the UI to reflect GitHub authentication status"""
         try:
-            if self.github_auth.is_authenticated():
-                self.menu_bar.update_github_auth_label(f"Sign Out ({self.github_auth.user_info['login']})")
+            status = self.github_auth.get_status()
+            if status['authenticated']:
+                self.menu_bar.update_github_auth_label(f"Sign Out ({status['username']})")
             else:
                 self.menu_bar.update_github_auth_label("Sign In with GitHub")
         except Exception as e:
@@ -7,6 +7,107 @@ import os
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 from tkinter.ttk import Scrollbar
+from string import Template
+
+# Template bodies are compiled once; only the header fields vary per keystroke
+_PY_TEMPLATE = Template("""# NAME: $name
+# DEVELOPER: $developer
+# LINK: $link
+# DESCRIPTION: $desc
+# UNDOABLE: $undoable
+# UNDO_DESC: $undo_desc
+#
+# This is a Python script template with undo capability
+
+import os
+import sys
+import argparse
+
+def main():
+    parser = argparse.ArgumentParser(description='$desc')
+    parser.add_argument('--undo', action='store_true', help='Undo the changes made by this script')
+    args = parser.parse_args()
+    
+    if args.undo:
+        perform_undo()
+    else:
+        perform_action()
+
+def perform_action():
+    print("Performing main action...")
+    # Your main code here
+    
+def perform_undo():
+    print("Performing undo action...")
+    # Your undo code here
+
+if __name__ == "__main__":
+    main()
+""")
+
+_PS_TEMPLATE = Template("""# NAME: $name
+# DEVELOPER: $developer
+# LINK: $link
+# DESCRIPTION: $desc
+# UNDOABLE: $undoable
+# UNDO_DESC: $undo_desc
+#
+# This is a PowerShell script template with undo capability
+
+param (
+    [switch]$$Undo
+)
+
+function Perform-Action {
+    Write-Host "Performing main action..."
+    # Your main code here
+}
+
+function Perform-Undo {
+    Write-Host "Performing undo action..."
+    # Your undo code here
+}
+
+if ($$Undo) {
+    Perform-Undo
+} else {
+    Perform-Action
+}
+""")
+
+_BAT_TEMPLATE = Template(""":: NAME: $name
+:: DEVELOPER: $developer
+:: LINK: $link
+:: DESCRIPTION: $desc
+:: UNDOABLE: $undoable
+:: UNDO_DESC: $undo_desc
+::
+:: This is a Batch script template with undo capability
+
+@echo off
+
+if "%1"=="undo" goto :undo
+
+:main
+echo Performing main action...
+:: Your main code here
+goto :end
+
+:undo
+echo Performing undo action...
+:: Your undo code here
+goto :end
+
+:end
+pause
+""")
+
+_TEMPLATES = {
+    ".py": _PY_TEMPLATE,
+    ".ps1": _PS_TEMPLATE,
+    ".bat": _BAT_TEMPLATE,
+    ".cmd": _BAT_TEMPLATE,
+}
 
 def create_new_script_dialog(parent, category, category_dir, refresh_callback):
     """Create a new script in the selected category"""
@@ -187,101 +288,12 @@ def create_new_script_dialog(parent, category, category_dir, refresh_callback):
             template_text.config(state="normal")
             undoable_check.config(state="normal")
         
-        if script_type == ".py":
+        template = _TEMPLATES.get(script_type)
+        if template is not None:
             template_text.delete(1.0, tk.END)
-            template_text.insert(tk.END, f"""# NAME: {name}
-# DEVELOPER: {developer}
-# LINK: {link}
-# DESCRIPTION: {desc}
-# UNDOABLE: {undoable}
-# UNDO_DESC: {undo_desc}
-#
-# This is a Python script template with undo capability
-
-import os
-import sys
-import argparse
-
-def main():
-    parser = argparse.ArgumentParser(description='{desc}')
-    parser.add_argument('--undo', action='store_true', help='Undo the changes made by this script')
-    args = parser.parse_args()
-    
-    if args.undo:
-        perform_undo()
-    else:
-        perform_action()
-
-def perform_action():
-    print("Performing main action...")
-    # Your main code here
-    
-def perform_undo():
-    print("Performing undo action...")
-    # Your undo code here
-
-if __name__ == "__main__":
-    main()
-""")
-        elif script_type == ".ps1":
-            template_text.delete(1.0, tk.END)
-            template_text.insert(tk.END, f"""# NAME: {name}
-# DEVELOPER: {developer}
-# LINK: {link}
-# DESCRIPTION: {desc}
-# UNDOABLE: {undoable}
-# UNDO_DESC: {undo_desc}
-#
-# This is a PowerShell script template with undo capability
-
-param (
-    [switch]$Undo
-)
-
-function Perform-Action {{
-    Write-Host "Performing main action..."
-    # Your main code here
-}}
-
-function Perform-Undo {{
-    Write-Host "Performing undo action..."
-    # Your undo code here
-}}
-
-if ($Undo) {{
-    Perform-Undo
-}} else {{
-    Perform-Action
-}}
-""")
-        elif script_type in [".bat", ".cmd"]:
-            template_text.delete(1.0, tk.END)
-            template_text.insert(tk.END, f""":: NAME: {name}
-:: DEVELOPER: {developer}
-:: LINK: {link}
-:: DESCRIPTION: {desc}
-:: UNDOABLE: {undoable}
-:: UNDO_DESC: {undo_desc}
-::
-:: This is a Batch script template with undo capability
-
-@echo off
-
-if "%1"=="undo" goto :undo
-
-:main
-echo Performing main action...
-:: Your main code here
-goto :end
-
-:undo
-echo Performing undo action...
-:: Your undo code here
-goto :end
-
-:end
-pause
-""")
+            template_text.insert(tk.END, template.safe_substitute(
+                name=name, developer=developer, link=link, desc=desc,
+                undoable=undoable, undo_desc=undo_desc))
             
         if undoable_var.get():
             undo_desc_entry.config(state="normal")
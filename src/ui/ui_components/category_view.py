@@ -12,6 +12,26 @@ from tkinter import ttk, messagebox, simpledialog
 
 from src.utils.message_handler import MessageHandler
 
+# Characters that are not allowed in a category name
+_INVALID_NAME_RE = re.compile(r'[^a-zA-Z0-9_\-\s]')
+
+
+def _list_subdirectories(path):
+    """
+    List the names of the directories directly inside a directory
+    
+    os.scandir returns each entry's type with the listing, so no separate
+    stat call is needed per entry.
+    
+    Args:
+        path: The directory to list
+        
+    Returns:
+        list: Directory names
+    """
+    with os.scandir(path) as entries:
+        return [entry.name for entry in entries if entry.is_dir()]
+
 
 class CategoryView:
     def __init__(self, parent, base_dir, primary_color="#4a86e8", secondary_color="#f0f0f0"):
@@ -21,6 +41,11 @@ class CategoryView:
         self.secondary_color = secondary_color
         self.categories = []
         
+        # Category directories already ensured to exist, and the last listing
+        # of the base directory with its modification time
+        self._created_dirs = set()
+        self._base_dir_listing = (None, [])
+        
         # Create the UI components
         self.frame = ttk.Frame(parent, width=250)
         self.create_category_view()
@@ -92,7 +117,10 @@ class CategoryView:
             # First add all main categories
             for category in sorted_categories:
                 category_path = os.path.join(self.base_dir, category)
-                os.makedirs(category_path, exist_ok=True)
+                # Only create each directory once per session, not on every refresh
+                if category_path not in self._created_dirs:
+                    os.makedirs(category_path, exist_ok=True)
+                    self._created_dirs.add(category_path)
                 
                 # Use after() to update UI from a background thread
                 self.parent.after(0, lambda c=category, p=category_path: 
@@ -134,12 +162,20 @@ class CategoryView:
     def _detect_custom_folders_async(self):
         """Detect custom folders asynchronously"""
         try:
-            base_dirs = [d for d in os.listdir(self.base_dir) 
-                        if os.path.isdir(os.path.join(self.base_dir, d))]
+            # Adding, removing or renaming a folder changes the directory's
+            # modification time, so an unchanged time means an unchanged listing
+            mtime = os.stat(self.base_dir).st_mtime_ns
+            cached_mtime, base_dirs = self._base_dir_listing
+            if cached_mtime != mtime:
+                # Sort once per listing so custom folders are added in name order
+                base_dirs = _list_subdirectories(self.base_dir)
+                base_dirs.sort(key=str.lower)
+                self._base_dir_listing = (mtime, base_dirs)
+            known_categories = set(self.categories)
             new_categories = []
             
             for dir_name in base_dirs:
-                if dir_name not in self.categories:
+                if dir_name not in known_categories:
                     category_path = os.path.join(self.base_dir, dir_name)
                     
                     # Use after() to safely update UI from background thread
@@ -177,8 +213,7 @@ class CategoryView:
             if not os.path.exists(parent_path):
                 return
                 
-            subdirs = [d for d in os.listdir(parent_path) 
-                      if os.path.isdir(os.path.join(parent_path, d))]
+            subdirs = _list_subdirectories(parent_path)
                       
             for subdir in sorted(subdirs):
                 subdir_path = os.path.join(parent_path, subdir)
@@ -195,8 +230,7 @@ class CategoryView:
             if not os.path.exists(parent_path):
                 return
                 
-            subdirs = [d for d in os.listdir(parent_path) 
-                      if os.path.isdir(os.path.join(parent_path, d))]
+            subdirs = _list_subdirectories(parent_path)
                       
             for subdir in sorted(subdirs):
                 subdir_path = os.path.join(parent_path, subdir)
@@ -256,7 +290,7 @@ class CategoryView:
                 MessageHandler.error("Please enter a category name.", "Error", console_only=False)
                 return
                 
-            clean_name = re.sub(r'[^a-zA-Z0-9_\-\s]', '', new_category)
+            clean_name = _INVALID_NAME_RE.sub('', new_category)
             if not clean_name:
                 MessageHandler.error("Please enter a valid category name.", "Invalid Name", console_only=False)
                 return
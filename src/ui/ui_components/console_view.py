@@ -13,6 +13,9 @@ from src.utils.console_redirector import ConsoleRedirector
 
 
 class ConsoleView:
+    # Oldest lines are dropped once the console holds more than this many
+    MAX_LINES = 2000
+    
     def __init__(self, parent, primary_color="#4a86e8", bg_dark="#2d2d2d"):
         self.parent = parent
         self.primary_color = primary_color
@@ -55,6 +58,10 @@ class ConsoleView:
             selectbackground=self.primary_color,
             font=("Consolas", 10))
         self.console.pack(fill=tk.BOTH, expand=True)
+        
+        self.console.tag_config("error", foreground="#ff5252")
+        self.console.tag_config("warning", foreground="#ffc107")
+        self.console.tag_config("header", foreground="#4a86e8", font=("Consolas", 10, "bold"))
     
     def redirect_output(self):
         """Redirect stdout and stderr to the console"""
@@ -74,11 +81,11 @@ class ConsoleView:
     def update_console(self):
         """Update the console with queued output"""
         try:
+            inserted = False
             while not self.console_queue.empty():
                 text = self.console_queue.get_nowait()
                 self.console.insert(tk.END, text)
-                self.console.see(tk.END)
-                self.console.update_idletasks()
+                inserted = True
                 
                 # Apply some basic syntax highlighting
                 if "ERROR:" in text or "Error:" in text:
@@ -90,7 +97,6 @@ class ConsoleView:
                         if not line_end:
                             line_end = tk.END
                         self.console.tag_add("error", start_pos, line_end)
-                        self.console.tag_config("error", foreground="#ff5252")
                 
                 elif "WARNING:" in text or "Warning:" in text:
                     start_pos = self.console.search("WARNING:", tk.END+"-50c linestart", tk.END, backwards=True)
@@ -101,7 +107,6 @@ class ConsoleView:
                         if not line_end:
                             line_end = tk.END
                         self.console.tag_add("warning", start_pos, line_end)
-                        self.console.tag_config("warning", foreground="#ffc107")
                 
                 elif "===" in text:
                     start_pos = self.console.search("===", tk.END+"-50c linestart", tk.END, backwards=True)
@@ -110,7 +115,15 @@ class ConsoleView:
                         if not line_end:
                             line_end = tk.END
                         self.console.tag_add("header", start_pos, line_end)
-                        self.console.tag_config("header", foreground="#4a86e8", font=("Consolas", 10, "bold"))
+            
+            if inserted:
+                # Keep the widget bounded so long sessions don't slow it down
+                line_count = int(self.console.index("end-1c").split(".")[0])
+                if line_count > self.MAX_LINES:
+                    self.console.delete("1.0", f"{line_count - self.MAX_LINES + 1}.0")
+                
+                # Scroll once per batch rather than once per message
+                self.console.see(tk.END)
                 
         except Exception as e:
             self.old_stdout.write(f"Error updating console: {str(e)}\n")
@@ -6,22 +6,31 @@ Handles the script list display and interactions
 
 import os
 import threading
+from collections import OrderedDict
 import tkinter as tk
 from tkinter import ttk, messagebox
 import webbrowser
 
 from src.ui.tooltip import ToolTip
-from src.utils.script_metadata import parse_script_metadata
+from src.utils.script_metadata import parse_metadata_batch, list_script_files
 from src.utils.message_handler import MessageHandler
 
 
 class ScriptView:
+    # Number of category listings kept; the least recently viewed are
+    # dropped beyond this
+    MAX_CACHED_LISTINGS = 64
+    
     def __init__(self, parent, primary_color="#4a86e8", rating_system=None):
         self.parent = parent
         self.primary_color = primary_color
-        self.script_extensions = ['.ps1', '.py', '.bat', '.cmd', '.exe']
         self.rating_system = rating_system
         
+        # Script files of each category directory, keyed by directory path
+        # and stored with the directory's modification time, ordered from
+        # least to most recently used
+        self._listing_cache = OrderedDict()
+        
         # Create UI components
         self.frame = ttk.Frame(parent)
         self.create_script_view()
@@ -125,47 +134,66 @@ class ScriptView:
         # Return immediately to keep UI responsive
         return 0
         
+    def _list_script_files(self, category_path):
+        """
+        List the script files of a category directory
+        
+        Adding, removing or renaming a file changes the directory's
+        modification time, so the listing is reused until that time changes.
+        Edits to a script's contents are picked up by the metadata cache.
+        
+        Args:
+            category_path: Path to the category directory
+            
+        Returns:
+            list: (script type, file path) tuples
+        """
+        try:
+            mtime = os.stat(category_path).st_mtime_ns
+        except FileNotFoundError:
+            os.makedirs(category_path, exist_ok=True)
+            mtime = os.stat(category_path).st_mtime_ns
+        
+        cached = self._listing_cache.get(category_path)
+        if cached and cached[0] == mtime:
+            self._listing_cache.move_to_end(category_path)
+            return cached[1]
+        
+        script_files = list_script_files(category_path)
+        self._listing_cache[category_path] = (mtime, script_files)
+        self._listing_cache.move_to_end(category_path)
+        while len(self._listing_cache) > self.MAX_CACHED_LISTINGS:
+            self._listing_cache.popitem(last=False)
+        return script_files
+        
     def _load_scripts_async(self, category_path, category_name):
         """Async worker for loading scripts"""
         try:
-            # Ensure directory exists
-            os.makedirs(category_path, exist_ok=True)
-            
             # Load and sort scripts
             scripts = []
             try:
-                for file in os.listdir(category_path):
-                    file_path = os.path.join(category_path, file)
-                    if os.path.isfile(file_path):
-                        _, ext = os.path.splitext(file)
-                        if ext.lower() in self.script_extensions:
-                            script_type = ext.lstrip(".").upper()
-                            friendly_name, description, undoable, undo_desc, developer, link = parse_script_metadata(file_path)
-                            
-                            # Get rating if rating system is available
-                            rating_text = ""
-                            rating_value = None
-                            if self.rating_system:
-                                avg_rating = self.rating_system.get_average_rating(file_path, friendly_name)
-                                if avg_rating:
-                                    rating_text = f"{avg_rating}/5"
-                                    rating_value = avg_rating
-                            
-                            scripts.append((
-                                script_type, 
-                                friendly_name, 
-                                developer, 
-                                description, 
-                                rating_text,  # Add rating text
-                                undoable, 
-                                undo_desc, 
-                                file_path, 
-                                link,
-                                rating_value  # Add rating value for sorting
-                            ))
+                script_files = self._list_script_files(category_path)
+                
+                # Parse all scripts of the category concurrently
+                all_metadata = parse_metadata_batch([file_path for _, file_path in script_files])
+                for (script_type, file_path), metadata in zip(script_files, all_metadata):
+                    friendly_name, description, undoable, undo_desc, developer, link = metadata
+                    
+                    scripts.append((
+                        script_type, 
+                        friendly_name, 
+                        developer, 
+                        description, 
+                        "",  # Rating text, filled in by load_ratings
+                        undoable, 
+                        undo_desc, 
+                        file_path, 
+                        link,
+                        None  # Rating value for sorting, filled in by load_ratings
+                    ))
             except Exception as e:
                 print(f"Error reading scripts: {str(e)}")
-                
+            
             # Sort scripts by name
             sorted_scripts = sorted(scripts, key=lambda x: x[1].lower())
             
@@ -180,6 +208,7 @@ class ScriptView:
                     self.scripts_label.config(text=f"Scripts - {category_name}")
                     
                     # Add scripts to tree
+                    rating_keys = {}
                     for script_data in sorted_scripts:
                         script_type, friendly_name, developer, description, rating_text, undoable, undo_desc, script_path, link, rating_value = script_data
                         
@@ -194,12 +223,16 @@ class ScriptView:
                             tags.append(f"rating_{rating_value}")
                             tags.append("has_rating")
                         
-                        self.scripts_tree.insert("", tk.END, 
+                        item = self.scripts_tree.insert("", tk.END, 
                             values=(script_type, friendly_name, developer, description, rating_text, "Yes" if undoable else "No"), 
                             tags=tags
                         )
+                        rating_keys[item] = (script_path, friendly_name)
                         
                     print(f"Loaded {len(sorted_scripts)} scripts in {category_name}")
+                    
+                    # The list is shown without waiting for GitHub
+                    self.load_ratings(rating_keys)
                 except Exception as e:
                     print(f"Error updating script UI: {str(e)}")
             
@@ -213,6 +246,48 @@ class ScriptView:
             self.parent.after(0, lambda: self.scripts_label.config(text=f"Scripts - {category_name} (Error loading)"))
             self.parent.after(0, lambda: MessageHandler.error(error_msg, "Script Loading Error"))
         
+    def load_ratings(self, rating_keys):
+        """
+        Fetch the average ratings of listed scripts in the background and fill them in
+        
+        Args:
+            rating_keys: (script_path, script_name) keyed by tree item ID
+        """
+        if not self.rating_system or not rating_keys:
+            return
+        
+        def fetch_ratings():
+            try:
+                ratings = self.rating_system.get_average_ratings(list(rating_keys.values()))
+                self.parent.after(0, lambda: self._apply_ratings(rating_keys, ratings))
+            except Exception as e:
+                print(f"Error loading ratings: {str(e)}")
+        
+        threading.Thread(target=fetch_ratings, daemon=True).start()
+    
+    def _apply_ratings(self, rating_keys, ratings):
+        """
+        Show fetched ratings in the rows that are still listed
+        
+        Args:
+            rating_keys: (script_path, script_name) keyed by tree item ID
+            ratings: Average rating (or None) keyed by (script_path, script_name)
+        """
+        try:
+            for item, key in rating_keys.items():
+                avg_rating = ratings.get(key)
+                # Rows may have been replaced while the ratings were fetched
+                if not avg_rating or not self.scripts_tree.exists(item):
+                    continue
+                
+                values = list(self.scripts_tree.item(item, 'values'))
+                values[4] = f"{avg_rating}/5"
+                tags = list(self.scripts_tree.item(item, 'tags'))
+                tags.extend((f"rating_{avg_rating}", "has_rating"))
+                self.scripts_tree.item(item, values=values, tags=tags)
+        except Exception as e:
+            print(f"Error updating ratings: {str(e)}")
+        
     def filter_scripts(self, event=None):
         """Filter scripts based on search text"""
         pass  # This will be implemented in the app class since it needs access to all categories
@@ -12,6 +12,13 @@ import threading
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 
+# Common built-in modules that never need installing
+_BUILTIN_MODULES = frozenset({
+    'os', 'sys', 'io', 're', 'time', 'datetime', 'math',
+    'json', 'random', 'threading', 'queue', 'tkinter', 'ctypes',
+    'argparse', 'subprocess', 'traceback'
+})
+
 
 class DependencyManager:
     def __init__(self, parent=None, primary_color="#4a86e8", secondary_color="#f0f0f0", 
@@ -63,9 +70,7 @@ class DependencyManager:
         missing_modules = []
         for mod in modules:
             # Skip common built-ins
-            if mod in ['os', 'sys', 'io', 're', 'time', 'datetime', 'math', 
-                      'json', 'random', 'threading', 'queue', 'tkinter', 'ctypes',
-                      'argparse', 'subprocess', 'traceback']:
+            if mod in _BUILTIN_MODULES:
                 continue
                 
             try:
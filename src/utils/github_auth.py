@@ -8,6 +8,8 @@ import os
 import json
 import webbrowser
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import threading
 import time
 import tkinter as tk
@@ -23,6 +25,18 @@ class GitHubAuthHandler:
         self.scope = scope
         self.token = None
         self.user_info = None
+        self._username = None
+        
+        # user_info is trusted for this many seconds before it is fetched again
+        self._user_info_ts = 0
+        self._user_info_ttl = 300
+        
+        # Keep connections to github.com and api.github.com alive between the
+        # device flow polls and user info checks
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+        ))
         
         # Device flow URLs
         self.device_code_url = "https://github.com/login/device/code"
@@ -35,13 +49,6 @@ class GitHubAuthHandler:
     def load_cached_token(self):
         """Load the cached GitHub token if available"""
         try:
-            if not os.path.exists(os.path.dirname(self.token_cache_path)):
-                os.makedirs(os.path.dirname(self.token_cache_path), exist_ok=True)
-                return False
-                
-            if not os.path.exists(self.token_cache_path):
-                return False
-                
             with open(self.token_cache_path, 'r') as f:
                 data = json.load(f)
                 self.token = data.get('token')
@@ -54,6 +61,9 @@ class GitHubAuthHandler:
                     # Invalid token
                     self.token = None
                     return False
+        except FileNotFoundError:
+            # No token has been cached yet
+            return False
         except Exception as e:
             print(f"Error loading cached token: {str(e)}")
             self.token = None
@@ -65,12 +75,15 @@ class GitHubAuthHandler:
             return
             
         try:
-            if not os.path.exists(os.path.dirname(self.token_cache_path)):
-                os.makedirs(os.path.dirname(self.token_cache_path), exist_ok=True)
+            os.makedirs(os.path.dirname(self.token_cache_path), exist_ok=True)
                 
-            with open(self.token_cache_path, 'w') as f:
+            # Write to a temporary file and swap it in, so an interrupted
+            # write can't leave a truncated token behind
+            tmp_path = self.token_cache_path + '.tmp'
+            with open(tmp_path, 'w') as f:
                 json.dump({'token': self.token}, f)
-                print("Saved GitHub token to cache")
+            os.replace(tmp_path, self.token_cache_path)
+            print("Saved GitHub token to cache")
         except Exception as e:
             print(f"Error saving token to cache: {str(e)}")
     
@@ -84,10 +97,12 @@ class GitHubAuthHandler:
                 'Authorization': f'token {self.token}',
                 'Accept': 'application/vnd.github.v3+json'
             }
-            response = requests.get('https://api.github.com/user', headers=headers)
+            response = self.session.get('https://api.github.com/user', headers=headers)
             
             if response.status_code == 200:
                 self.user_info = response.json()
+                self._username = self.user_info.get('login')
+                self._user_info_ts = time.time()
                 return self.user_info
             else:
                 print(f"Error fetching user info: {response.status_code}")
@@ -96,9 +111,42 @@ class GitHubAuthHandler:
             print(f"Error getting user info: {str(e)}")
             return None
     
+    def get_username(self):
+        """
+        Get the login of the authenticated user
+        
+        The login is remembered whenever user info is fetched, so this never
+        makes a network request.
+        
+        Returns:
+            str: The GitHub login, or None if not signed in
+        """
+        return self._username
+    
+    def get_status(self):
+        """
+        Get the authentication state and username in one call
+        
+        Returns:
+            dict: 'authenticated' (bool) and 'username' (str, or None if
+                  not signed in)
+        """
+        authenticated = self.is_authenticated()
+        return {
+            'authenticated': authenticated,
+            'username': self._username if authenticated else None
+        }
+    
     def is_authenticated(self):
         """Check if the user is authenticated with GitHub"""
-        return self.token is not None and self.get_user_info() is not None
+        if self.token is None:
+            return False
+        
+        # Recently fetched user info means the token is still good
+        if self.user_info is not None and time.time() - self._user_info_ts < self._user_info_ttl:
+            return True
+        
+        return self.get_user_info() is not None
     
     def authenticate(self):
         """Start the GitHub Device Flow authentication"""
@@ -127,7 +175,7 @@ class GitHubAuthHandler:
                 'scope': self.scope
             }
             
-            response = requests.post(self.device_code_url, headers=headers, data=data)
+            response = self.session.post(self.device_code_url, headers=headers, data=data)
             
             if response.status_code != 200:
                 print(f"Error requesting device code: {response.status_code}, {response.text}")
@@ -264,6 +312,33 @@ class GitHubAuthHandler:
         # Auto-open browser
         dialog.after(500, open_browser)
     
+    def _set_auth_status(self, message, close_dialog=False):
+        """
+        Show the authentication status in the device code dialog
+        
+        Called from the polling thread, so all Tk calls are handed to the
+        main loop with after().
+        
+        Args:
+            message: Text for the dialog's status line
+            close_dialog: Whether to close the dialog after a short delay
+        """
+        if not self.parent or not hasattr(self, 'auth_dialog'):
+            return
+        
+        def update_dialog():
+            if not self.auth_dialog.winfo_exists():
+                return
+            self.status_var.set(message)
+            if close_dialog:
+                self.auth_dialog.after(2000, self.auth_dialog.destroy)
+        
+        try:
+            self.parent.after(0, update_dialog)
+        except (RuntimeError, tk.TclError):
+            # The main window is gone
+            pass
+    
     def _poll_for_token(self, device_code, interval, expires_in):
         """Poll for token using the device code"""
         headers = {
@@ -279,7 +354,7 @@ class GitHubAuthHandler:
         
         while time.time() - start_time < expires_in:
             try:
-                response = requests.post(self.token_url, headers=headers, data=data)
+                response = self.session.post(self.token_url, headers=headers, data=data)
                 response_data = response.json()
                 
                 if 'access_token' in response_data:
@@ -290,13 +365,10 @@ class GitHubAuthHandler:
                     # Get user info
                     user_info = self.get_user_info()
                     if user_info:
-                        username = user_info.get('login', 'User')
+                        username = self._username or 'User'
                         print(f"Authenticated as: {username}")
-                        
-                        if hasattr(self, 'auth_dialog') and self.auth_dialog.winfo_exists():
-                            self.status_var.set(f"Authentication successful! Welcome, {username}.")
-                            self.auth_success = True
-                            self.parent.after(2000, self.auth_dialog.destroy)
+                        self.auth_success = True
+                        self._set_auth_status(f"Authentication successful! Welcome, {username}.", close_dialog=True)
                     
                     return True
                     
@@ -305,64 +377,52 @@ class GitHubAuthHandler:
                     
                     if error == 'authorization_pending':
                         # Expected error, user hasn't authorized yet
-                        if hasattr(self, 'status_var'):
-                            self.status_var.set("Waiting for you to authorize in the browser...")
+                        self._set_auth_status("Waiting for you to authorize in the browser...")
                     elif error == 'slow_down':
                         # GitHub is telling us to slow down our polling
                         interval += 5
-                        if hasattr(self, 'status_var'):
-                            self.status_var.set("Polling slowed down, please wait...")
+                        self._set_auth_status("Polling slowed down, please wait...")
                     elif error == 'expired_token':
                         # Token has expired
                         print("Device code expired. Please try again.")
-                        if hasattr(self, 'status_var'):
-                            self.status_var.set("Code expired. Please try again.")
-                        if hasattr(self, 'auth_dialog') and self.auth_dialog.winfo_exists():
-                            self.parent.after(2000, self.auth_dialog.destroy)
+                        self._set_auth_status("Code expired. Please try again.", close_dialog=True)
                         return False
                     elif error == 'access_denied':
                         # User declined the authorization
                         print("Authorization denied by user.")
-                        if hasattr(self, 'status_var'):
-                            self.status_var.set("Authorization denied. Please try again.")
-                        if hasattr(self, 'auth_dialog') and self.auth_dialog.winfo_exists():
-                            self.parent.after(2000, self.auth_dialog.destroy)
+                        self._set_auth_status("Authorization denied. Please try again.", close_dialog=True)
                         return False
                     else:
                         # Other error
                         print(f"Error during polling: {error}")
-                        if hasattr(self, 'status_var'):
-                            self.status_var.set(f"Error: {error}")
-                        if hasattr(self, 'auth_dialog') and self.auth_dialog.winfo_exists():
-                            self.parent.after(2000, self.auth_dialog.destroy)
+                        self._set_auth_status(f"Error: {error}", close_dialog=True)
                         return False
             
             except Exception as e:
                 print(f"Error during token polling: {str(e)}")
-                if hasattr(self, 'status_var'):
-                    self.status_var.set(f"Connection error, retrying...")
+                self._set_auth_status("Connection error, retrying...")
             
             # Wait for the specified interval before polling again
             time.sleep(interval)
         
         # If we get here, we've exceeded the expiration time
         print("Authentication timed out.")
-        if hasattr(self, 'status_var'):
-            self.status_var.set("Authentication timed out. Please try again.")
-        if hasattr(self, 'auth_dialog') and self.auth_dialog.winfo_exists():
-            self.parent.after(2000, self.auth_dialog.destroy)
+        self._set_auth_status("Authentication timed out. Please try again.", close_dialog=True)
         return False
     
     def logout(self):
         """Log out the user by clearing the token"""
         self.token = None
         self.user_info = None
+        self._username = None
+        self._user_info_ts = 0
         
         # Remove the token cache file
         try:
-            if os.path.exists(self.token_cache_path):
-                os.remove(self.token_cache_path)
-                print("Removed GitHub token cache")
+            os.remove(self.token_cache_path)
+            print("Removed GitHub token cache")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error removing token cache: {str(e)}")
         
@@ -4,15 +4,225 @@ Functions for downloading scripts from GitHub repositories
 """
 
 import os
-import sys
+import re
+import json
+import zlib
+import hashlib
+import queue
 import traceback
-import tempfile
 import shutil
-import zipfile
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, unquote
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from src.utils.script_metadata import SCRIPT_EXTENSIONS
+
+# Accepted repository URLs: github.com/username/repository, optionally
+# followed by further path segments (e.g. /tree/branch/path or /blob/...)
+_VALID_URL_RE = re.compile(r'^(?:https?://)?(?:www\.)?github\.com/[\w.-]+/[\w.-]+(?:/[^\s?#]*)?(?:[?#]\S*)?$')
+
+# Shared HTTP session, created on the first download
+_session = None
+
+def _http_session():
+    """
+    Get the HTTP session used for downloads
+    
+    The session keeps connections to GitHub alive between downloads, so a
+    repeated download or revalidation skips the TCP and TLS handshakes.
+    requests is imported here so that starting the app doesn't pay for it.
+    
+    Returns:
+        requests.Session: The shared session
+    """
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        _session = requests.Session()
+        _session.headers.update({
+            'User-Agent': 'WinPick/1.0',
+            # Zipballs are already compressed
+            'Accept-Encoding': 'identity'
+        })
+        _session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=4))
+    return _session
+
+def _parse_repo_url(repo_url):
+    """
+    Split a GitHub repository URL into its parts
+    
+    Path segments after username/repository are ignored unless they form a
+    /tree/branch/path link. Branch names containing "/" are not supported
+    there, as the first segment after /tree/ is taken as the branch.
+    
+    Args:
+        repo_url: URL such as https://github.com/username/repository or
+                  https://github.com/username/repository/tree/branch/path
+        
+    Returns:
+        tuple: (username, repository, branch, subdirectory), where branch and
+               subdirectory are None unless the URL names them, or None if the
+               URL is not a valid repository URL
+    """
+    if not _VALID_URL_RE.match(repo_url):
+        return None
+    
+    if '://' not in repo_url:
+        repo_url = 'https://' + repo_url
+    path_parts = urlsplit(repo_url).path.strip('/').split('/')
+    
+    username, repository = path_parts[0], path_parts[1]
+    branch = None
+    subdirectory = None
+    if len(path_parts) > 3 and path_parts[2] == 'tree':
+        branch = path_parts[3]
+        subdirectory = unquote('/'.join(path_parts[4:])) or None
+    return username, repository, branch, subdirectory
+
+def _fast_listing(root):
+    """
+    List every file below a directory with a single os.scandir traversal
+    
+    Args:
+        root: The directory to list
+        
+    Yields:
+        str: Path of each file relative to root, normalised with os.path.normcase
+    """
+    pending = [""]
+    while pending:
+        rel_dir = pending.pop()
+        try:
+            with os.scandir(os.path.join(root, rel_dir)) as entries:
+                for entry in entries:
+                    rel_path = os.path.join(rel_dir, entry.name)
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(rel_path)
+                    else:
+                        yield os.path.normcase(rel_path)
+        except OSError:
+            continue
+
+def _member_path(extract_dir, member_name):
+    """
+    Map a zip member name to a path below extract_dir
+    
+    Returns:
+        str: The target path, or None for names that would escape extract_dir
+    """
+    parts = [part for part in member_name.replace('\\', '/').split('/') if part not in ('', '.')]
+    if not parts or '..' in parts or ':' in parts[0]:
+        return None
+    return os.path.join(extract_dir, *parts)
+
+def _file_crc32(path):
+    """Compute the CRC-32 of a file, matching the value zip archives store"""
+    crc = 0
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1<<20), b''):
+            crc = zlib.crc32(block, crc)
+    return crc
+
+def _extract_members(zip_path, members):
+    """
+    Extract a batch of zip members using a private ZipFile handle
+    
+    ZipFile objects are not safe to share between threads, so every worker
+    opens the archive itself. Each member is written to a ".part" file that
+    replaces the target only once it has been read in full, as zipfile only
+    checks the CRC at the end; a corrupt archive or failed write leaves the
+    existing file untouched.
+    
+    Args:
+        zip_path: Path to the zip file
+        members: List of (ZipInfo, target path) tuples
+    """
+    import zipfile
+    
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        for info, target in members:
+            part_path = target + '.part'
+            try:
+                with zip_ref.open(info) as source, open(part_path, 'wb') as dest:
+                    shutil.copyfileobj(source, dest, 1<<20)
+                os.replace(part_path, target)
+            except Exception:
+                try:
+                    os.remove(part_path)
+                except OSError:
+                    pass
+                raise
+
+def _repository_members(zip_path, subdirectory=None, extensions=None):
+    """
+    List the files of a GitHub zipball, read from its central directory
+    
+    Args:
+        zip_path: Path to the zip file
+        subdirectory: Only list this directory below the archive's top-level
+                      folder (None to list everything)
+        extensions: Only list files with one of these lowercase extensions
+                    (None to list every file)
+        
+    Returns:
+        list: (ZipInfo, path relative to the repository or subdirectory)
+              tuples, or None if the archive is empty or the subdirectory
+              does not exist
+    """
+    import zipfile
+    
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        infos = zip_ref.infolist()
+    
+    # GitHub zipballs hold a single top-level folder (username-repository-hash);
+    # take its name from the first nested entry rather than assuming the
+    # first entry is the folder itself
+    root = next((info.filename.split('/', 1)[0] for info in infos if '/' in info.filename), None)
+    if root is None:
+        return None
+    
+    prefix = root + '/'
+    if subdirectory:
+        prefix += subdirectory.replace('\\', '/').strip('/') + '/'
+    
+    found = False
+    members = []
+    for info in infos:
+        if not info.filename.startswith(prefix):
+            continue
+        found = True
+        if info.is_dir():
+            continue
+        rel_path = info.filename[len(prefix):]
+        if extensions is not None and os.path.splitext(rel_path)[1].lower() not in extensions:
+            continue
+        members.append((info, rel_path))
+    
+    return members if found else None
+
+def _extract_to(zip_path, members):
+    """
+    Extract zip members to their targets using a pool of worker threads
+    
+    Every entry has its own compressed stream, so entries can be inflated
+    and written independently. The target directories must already exist.
+    
+    Args:
+        zip_path: Path to the zip file
+        members: List of (ZipInfo, target path) tuples
+    """
+    if not members:
+        return
+    
+    workers = min(32, (os.cpu_count() or 1) * 4, len(members))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        batches = [executor.submit(_extract_members, zip_path, members[i::workers]) for i in range(workers)]
+        for batch in batches:
+            batch.result()
+
 class GitHubDownloader:
     def __init__(self, parent, base_dir):
         """
@@ -31,148 +241,268 @@ class GitHubDownloader:
         self.bg_dark = parent.bg_dark
         self.bg_light = parent.bg_light
         self.style = parent.style
+        
+        # Downloaded zipballs are cached per repository/branch and revalidated by ETag
+        self.cache_dir = os.path.join(os.path.expanduser("~"), ".winpick", "cache", "zipballs")
+        self.cache_meta_file = os.path.join(self.cache_dir, "cache_meta.json")
+        
+        # (mtime, size, crc32) of files written by previous downloads
+        self.crc_cache_file = os.path.join(os.path.expanduser("~"), ".winpick", "cache", "file_crcs.json")
+    
+    def load_cache_meta(self):
+        """Load the zipball cache metadata ({repo key: {'etag', 'zip_path'}})"""
+        try:
+            if os.path.exists(self.cache_meta_file):
+                with open(self.cache_meta_file, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"Warning: Failed to read download cache: {str(e)}")
+        return {}
+    
+    def save_cache_meta(self, cache_meta):
+        """Save the zipball cache metadata"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Replace the file in one step so an interrupted write can't
+            # leave ETags pointing at the wrong zipball
+            temp_file = f"{self.cache_meta_file}.tmp"
+            with open(temp_file, 'w') as f:
+                json.dump(cache_meta, f)
+            os.replace(temp_file, self.cache_meta_file)
+        except Exception as e:
+            print(f"Warning: Failed to save download cache: {str(e)}")
+    
+    def load_crc_cache(self):
+        """Load the cached checksums of previously downloaded files"""
+        try:
+            if os.path.exists(self.crc_cache_file):
+                with open(self.crc_cache_file, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"Warning: Failed to read checksum cache: {str(e)}")
+        return {}
+    
+    def save_crc_cache(self, crc_cache):
+        """Save the cached checksums of downloaded files"""
+        try:
+            os.makedirs(os.path.dirname(self.crc_cache_file), exist_ok=True)
+            temp_file = f"{self.crc_cache_file}.tmp"
+            with open(temp_file, 'w') as f:
+                json.dump(crc_cache, f)
+            os.replace(temp_file, self.crc_cache_file)
+        except Exception as e:
+            print(f"Warning: Failed to save checksum cache: {str(e)}")
+    
+    def is_unchanged(self, dest_file, zip_crc, crc_cache):
+        """
+        Check whether an existing file already matches a zip entry
+        
+        The destination checksum is only recomputed when its size or
+        modification time differs from the cached values.
+        
+        Args:
+            dest_file: Path of the existing file
+            zip_crc: CRC-32 stored in the zip archive for the new file
+            crc_cache: Checksum cache, updated in place
+            
+        Returns:
+            bool: True if the file contents are identical
+        """
+        if zip_crc is None:
+            return False
+        
+        try:
+            st = os.stat(dest_file)
+            key = os.path.normcase(dest_file)
+            cached = crc_cache.get(key)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                dest_crc = cached[2]
+            else:
+                dest_crc = _file_crc32(dest_file)
+                crc_cache[key] = [st.st_mtime_ns, st.st_size, dest_crc]
+            return dest_crc == zip_crc
+        except OSError:
+            return False
     
-    def download_repository(self, repo_url, directory_path=None, branch="main"):
+    def download_repository(self, repo_url, directory_path=None, branch=None):
         """
         Download a directory from a GitHub repository
         
         Args:
-            repo_url: GitHub repository URL (e.g., "https://github.com/username/repo")
+            repo_url: GitHub repository URL (e.g., "https://github.com/username/repo"),
+                      optionally ending in /tree/branch/path
             directory_path: Path to the directory within the repository to download (None for the whole repo)
-            branch: Branch to download from
+            branch: Branch to download from; when empty, the branch named by a
+                    /tree/ URL is used, or "main"
             
         Returns:
             tuple: (success, message)
         """
         try:
-            # Extract username and repository name from the URL
-            parts = repo_url.rstrip('/').split('/')
-            if 'github.com' not in parts:
+            parsed = _parse_repo_url(repo_url)
+            if parsed is None:
                 return False, "Invalid GitHub URL. It should be in the format: https://github.com/username/repository"
             
-            username_idx = parts.index('github.com') + 1
-            if username_idx >= len(parts):
-                return False, "Invalid GitHub URL. Username not found."
-            
-            repo_idx = username_idx + 1
-            if repo_idx >= len(parts):
-                return False, "Invalid GitHub URL. Repository name not found."
-            
-            username = parts[username_idx]
-            repository = parts[repo_idx]
+            # A /tree/branch/path URL supplies the branch and directory when
+            # they weren't given explicitly
+            username, repository, url_branch, url_directory = parsed
+            branch = branch or url_branch or "main"
+            directory_path = directory_path or url_directory
             
             # Construct the API URL to get the content
             api_url = f"https://api.github.com/repos/{username}/{repository}/zipball/{branch}"
             
             print(f"Downloading from GitHub: {repo_url}, branch: {branch}")
             
-            # Download the repository zip file
-            temp_dir = tempfile.mkdtemp()
-            zip_path = os.path.join(temp_dir, "repo.zip")
+            # Revalidate the cached zipball, if any, instead of downloading it again
+            cache_key = f"{username}/{repository}@{branch}"
+            cache_meta = self.load_cache_meta()
+            cached = cache_meta.get(cache_key)
+            headers = {}
+            if cached and os.path.exists(cached['zip_path']):
+                headers['If-None-Match'] = cached['etag']
             
-            print(f"Downloading repository to: {zip_path}")
-            response = requests.get(api_url, stream=True)
+            response = _http_session().get(api_url, stream=True, headers=headers)
             
-            if response.status_code != 200:
+            if response.status_code == 304:
+                zip_path = cached['zip_path']
+                print(f"Repository unchanged since last download, using cached copy: {zip_path}")
+            elif response.status_code == 200:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                # Name the file from a digest of the key; replacing characters
+                # could give two repositories or branches the same file
+                zip_path = os.path.join(self.cache_dir, hashlib.sha256(cache_key.encode('utf-8')).hexdigest() + ".zip")
+                partial_path = zip_path + ".part"
+                
+                print(f"Downloading repository to: {zip_path}")
+                with open(partial_path, 'wb') as f:
+                    # Reserve the full size up front so the file is allocated once
+                    # instead of being extended on every chunk
+                    content_length = response.headers.get('Content-Length')
+                    if content_length and content_length.isdigit():
+                        f.truncate(int(content_length))
+                        f.seek(0)
+                    # Copy straight from the raw stream in 1 MiB blocks rather
+                    # than looping over iter_content chunks in Python
+                    response.raw.decode_content = True
+                    shutil.copyfileobj(response.raw, f, 1<<20)
+                    # Trim any unused space (e.g. a compressed Content-Length)
+                    f.truncate()
+                os.replace(partial_path, zip_path)
+                
+                etag = response.headers.get('ETag')
+                if etag:
+                    cache_meta[cache_key] = {'etag': etag, 'zip_path': zip_path}
+                else:
+                    cache_meta.pop(cache_key, None)
+                self.save_cache_meta(cache_meta)
+                
+                print("Download completed, extracting files...")
+            else:
                 return False, f"Failed to download from GitHub. Status code: {response.status_code}, Message: {response.text}"
             
-            with open(zip_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-            
-            print("Download completed, extracting files...")
-            
-            # Extract the zip file
-            extract_dir = os.path.join(temp_dir, "extracted")
-            os.makedirs(extract_dir, exist_ok=True)
-            
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
-            
-            # Find the extracted folder (it will have a name like username-repository-hash)
-            extracted_items = os.listdir(extract_dir)
-            if not extracted_items:
-                return False, "Extraction failed: No files found in the downloaded repository."
-            
-            # The first item should be the repository folder
-            repo_folder = os.path.join(extract_dir, extracted_items[0])
-            
-            if directory_path:
-                # If a specific directory was requested, use that
-                repo_folder = os.path.join(repo_folder, directory_path)
-                if not os.path.exists(repo_folder):
+            # Decide what to write from the archive's central directory, then
+            # extract the chosen scripts straight to their destinations.
+            # Only scripts are shown by the app, so READMEs, images and other
+            # repository files are left in the archive.
+            members = _repository_members(zip_path, directory_path, SCRIPT_EXTENSIONS)
+            if members is None:
+                if directory_path:
                     return False, f"Directory '{directory_path}' not found in the repository."
+                return False, "Extraction failed: No files found in the downloaded repository."
             
             # Now, ask if the user wants to overwrite existing files
             overwrite_all = False
             skip_all = False
             file_count = 0
+            unchanged_count = 0
+            skipped_count = 0
+            crc_cache = self.load_crc_cache()
+            
+            # Look up existing files in one directory traversal instead of a stat per file
+            existing_files = set(_fast_listing(self.base_dir))
+            
+            # Check if we're using the default repo or a custom one
+            is_default_repo = (username.lower(), repository.lower()) == ("itsmikethetech", "winpick-scripts")
+            
+            # Members to extract once every overwrite decision has been made
+            extractions = []
             
-            # Recursively copy files, asking for overwrite confirmation as needed
-            for root, dirs, files in os.walk(repo_folder):
-                # Get the relative path from the repo_folder
-                rel_path = os.path.relpath(root, repo_folder)
-                # Create the destination directory
-                dest_dir = os.path.join(self.base_dir, rel_path) if rel_path != '.' else self.base_dir
-                os.makedirs(dest_dir, exist_ok=True)
+            for info, rel_path in members:
+                rel_dir, file = os.path.split(rel_path)
                 
-                # Check if we're using the default repo or a custom one
-                default_repo = "https://github.com/itsmikethetech/WinPick-Scripts"
-                is_default_repo = repo_url.strip('/').lower() == default_repo.lower()
+                # If using a custom repo, add the username and repo name as a prefix to the script name
+                if not is_default_repo:
+                    # Use username and repository as prefix
+                    base_filename, file_ext = os.path.splitext(file)
+                    dest_name = f"{username.lower()}-{repository.lower()}-{base_filename}{file_ext}"
+                else:
+                    dest_name = file
                 
-                # Copy all files, asking for overwrite confirmation if needed
-                for file in files:
-                    src_file = os.path.join(root, file)
-                    
-                    # If using a custom repo, add the username and repo name as a prefix to the script name
-                    if not is_default_repo:
-                        # Use username and repository as prefix
-                        base_filename, file_ext = os.path.splitext(file)
-                        prefixed_filename = f"{username.lower()}-{repository.lower()}-{base_filename}{file_ext}"
-                        dest_file = os.path.join(dest_dir, prefixed_filename)
-                    else:
-                        dest_file = os.path.join(dest_dir, file)
-                    
-                    if os.path.exists(dest_file) and not overwrite_all and not skip_all:
-                        # File already exists, ask for confirmation
-                        result = self.show_overwrite_dialog(file, dest_file)
-                        if result == "overwrite":
-                            shutil.copy2(src_file, dest_file)
-                            file_count += 1
-                            print(f"Overwritten file: {dest_file}")
-                        elif result == "overwrite_all":
-                            overwrite_all = True
-                            shutil.copy2(src_file, dest_file)
-                            file_count += 1
-                            print(f"Overwritten file: {dest_file}")
-                        elif result == "skip":
-                            print(f"Skipped file: {dest_file}")
-                        elif result == "skip_all":
-                            skip_all = True
-                            print(f"Skipped file: {dest_file}")
-                        elif result == "cancel":
-                            print("Download cancelled by user.")
-                            return False, "Download cancelled by user."
-                    elif os.path.exists(dest_file) and overwrite_all:
-                        # Overwrite all files
-                        shutil.copy2(src_file, dest_file)
+                dest_file = _member_path(self.base_dir, f"{rel_dir}/{dest_name}")
+                if dest_file is None:
+                    print(f"Warning: Skipping unsafe path in archive: {info.filename}")
+                    continue
+                
+                dest_exists = os.path.normcase(os.path.relpath(dest_file, self.base_dir)) in existing_files
+                
+                # Leave files that are already identical alone, without prompting
+                if dest_exists and self.is_unchanged(dest_file, info.CRC, crc_cache):
+                    unchanged_count += 1
+                    continue
+                
+                if dest_exists and not overwrite_all and not skip_all:
+                    # File already exists, ask for confirmation
+                    result = self.show_overwrite_dialog(file, dest_file)
+                    if result == "overwrite":
+                        extractions.append((info, dest_file))
+                        file_count += 1
+                    elif result == "overwrite_all":
+                        overwrite_all = True
+                        extractions.append((info, dest_file))
                         file_count += 1
-                        print(f"Overwritten file: {dest_file}")
-                    elif not os.path.exists(dest_file) or skip_all:
-                        # File doesn't exist, just copy it
-                        if not skip_all or not os.path.exists(dest_file):
-                            shutil.copy2(src_file, dest_file)
-                            file_count += 1
-                            print(f"Copied file: {dest_file}")
+                    elif result == "skip":
+                        skipped_count += 1
+                    elif result == "skip_all":
+                        skip_all = True
+                        skipped_count += 1
+                    elif result == "cancel":
+                        print("Download cancelled by user.")
+                        self.save_crc_cache(crc_cache)
+                        return False, "Download cancelled by user."
+                elif dest_exists and overwrite_all:
+                    # Overwrite all files
+                    extractions.append((info, dest_file))
+                    file_count += 1
+                elif not dest_exists:
+                    # File doesn't exist, just extract it
+                    extractions.append((info, dest_file))
+                    file_count += 1
+                else:
+                    skipped_count += 1
             
-            # Clean up temp files
-            try:
-                shutil.rmtree(temp_dir)
-            except Exception as e:
-                print(f"Warning: Failed to clean up temporary files: {str(e)}")
+            if extractions:
+                # Create each destination directory once, before the workers start
+                for dest_dir in sorted({os.path.dirname(dest) for _, dest in extractions}):
+                    os.makedirs(dest_dir, exist_ok=True)
+                
+                _extract_to(zip_path, extractions)
+                
+                # The archive's CRC-32 is the new file's checksum
+                for info, dest_file in extractions:
+                    st = os.stat(dest_file)
+                    crc_cache[os.path.normcase(dest_file)] = [st.st_mtime_ns, st.st_size, info.CRC]
             
-            return True, f"Successfully downloaded {file_count} files from GitHub."
+            self.save_crc_cache(crc_cache)
+            
+            # One summary line rather than a console write for every file
+            print(f"Copied {file_count} files to {self.base_dir} "
+                  f"({skipped_count} skipped, {unchanged_count} unchanged)")
+            
+            message = f"Successfully downloaded {file_count} files from GitHub."
+            if unchanged_count:
+                message += f" {unchanged_count} files were already up to date."
+            return True, message
             
         except Exception as e:
             error_msg = f"Error downloading from GitHub: {str(e)}\n{traceback.format_exc()}"
@@ -181,7 +511,10 @@ class GitHubDownloader:
     
     def show_overwrite_dialog(self, filename, filepath):
         """
-        Show a dialog asking whether to overwrite an existing file
+        Ask whether to overwrite an existing file
+        
+        Called from the download worker thread. The dialog itself is built on
+        the Tk main thread and the worker blocks until the user answers.
         
         Args:
             filename: The name of the file
@@ -190,6 +523,19 @@ class GitHubDownloader:
         Returns:
             str: One of "overwrite", "overwrite_all", "skip", "skip_all", "cancel"
         """
+        reply_queue = queue.Queue()
+        self.parent.after(0, self._build_overwrite_dialog, filename, filepath, reply_queue)
+        return reply_queue.get()
+    
+    def _build_overwrite_dialog(self, filename, filepath, reply_queue):
+        """
+        Build the overwrite dialog on the Tk main thread
+        
+        Args:
+            filename: The name of the file
+            filepath: The full path to the file
+            reply_queue: Queue that receives the user's choice
+        """
         dialog = tk.Toplevel(self.parent)
         dialog.title("File Exists")
         dialog.geometry("450x250")
@@ -202,9 +548,13 @@ class GitHubDownloader:
         y = self.parent.winfo_y() + (self.parent.winfo_height() // 2) - (250 // 2)
         dialog.geometry(f"+{x}+{y}")
         
+        def reply(value):
+            reply_queue.put(value)
+            dialog.destroy()
+        
         # Make dialog modal
         dialog.focus_set()
-        dialog.protocol("WM_DELETE_WINDOW", lambda: dialog.destroy())
+        dialog.protocol("WM_DELETE_WINDOW", lambda: reply("cancel"))
         
         frame = ttk.Frame(dialog, padding=20)
         frame.pack(fill=tk.BOTH, expand=True)
@@ -237,9 +587,6 @@ class GitHubDownloader:
                  foreground=self.primary_color,
                  wraplength=350).pack(anchor=tk.W)
         
-        # Result variable
-        result = tk.StringVar(value="cancel")
-        
         # Buttons
         button_frame = ttk.Frame(frame)
         button_frame.pack(fill=tk.X, pady=(20, 0))
@@ -247,37 +594,32 @@ class GitHubDownloader:
         cancel_btn = ttk.Button(button_frame, 
                               text="Cancel", 
                               width=15,
-                              command=lambda: [result.set("cancel"), dialog.destroy()])
+                              command=lambda: reply("cancel"))
         cancel_btn.pack(side=tk.RIGHT, padx=5)
         
         skip_all_btn = ttk.Button(button_frame, 
                                 text="Skip All", 
                                 width=15,
-                                command=lambda: [result.set("skip_all"), dialog.destroy()])
+                                command=lambda: reply("skip_all"))
         skip_all_btn.pack(side=tk.RIGHT, padx=5)
         
         skip_btn = ttk.Button(button_frame, 
                             text="Skip", 
                             width=15,
-                            command=lambda: [result.set("skip"), dialog.destroy()])
+                            command=lambda: reply("skip"))
         skip_btn.pack(side=tk.RIGHT, padx=5)
         
         overwrite_all_btn = ttk.Button(button_frame, 
                                      text="Overwrite All", 
                                      width=15,
-                                     command=lambda: [result.set("overwrite_all"), dialog.destroy()])
+                                     command=lambda: reply("overwrite_all"))
         overwrite_all_btn.pack(side=tk.LEFT, padx=5)
         
         overwrite_btn = ttk.Button(button_frame, 
                                  text="Overwrite", 
                                  width=15,
-                                 command=lambda: [result.set("overwrite"), dialog.destroy()])
+                                 command=lambda: reply("overwrite"))
         overwrite_btn.pack(side=tk.LEFT, padx=5)
-        
-        # Wait for the dialog to be closed
-        dialog.wait_window()
-        
-        return result.get()
     
     def show_download_dialog(self):
         """Show a dialog to download scripts from GitHub"""
@@ -405,10 +747,8 @@ class GitHubDownloader:
                         self.parent.after(0, update_ui_for_validation_error)
                         return
                     
-                    if not branch:
-                        branch = "main"
-                    
-                    # Perform the download
+                    # Perform the download; an empty branch falls back to the
+                    # URL's branch, then to "main"
                     success, message = self.download_repository(repo_url, dir_path, branch)
                     
                     # Use after method to safely update UI from the background thread
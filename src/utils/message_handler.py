@@ -5,12 +5,28 @@ Handles displaying messages to the user, either in console or as dialog
 """
 
 import tkinter as tk
-from tkinter import messagebox
+from contextlib import contextmanager
+from tkinter import ttk, messagebox, scrolledtext
 
 
 class MessageHandler:
     """Class to handle message display logic"""
     
+    # URLs the user has already agreed to open during this session
+    _url_decisions = {}
+    
+    # Dialog messages collected while a batch is open, shown together by end_batch
+    _batch_depth = 0
+    _batched_messages = []
+    
+    @classmethod
+    def _show(cls, show_func, level, title, message):
+        """Show a dialog, or queue it if a batch is open"""
+        if cls._batch_depth:
+            cls._batched_messages.append((show_func, level, title, message))
+        else:
+            show_func(title, message)
+    
     @staticmethod
     def info(message, title="Information", console_only=True):
         """
@@ -24,7 +40,7 @@ class MessageHandler:
         print(f"INFO: {message}")
         
         if not console_only:
-            messagebox.showinfo(title, message)
+            MessageHandler._show(messagebox.showinfo, "INFO", title, message)
     
     @staticmethod
     def error(message, title="Error", console_only=False):
@@ -39,7 +55,7 @@ class MessageHandler:
         print(f"ERROR: {message}")
         
         if not console_only:
-            messagebox.showerror(title, message)
+            MessageHandler._show(messagebox.showerror, "ERROR", title, message)
     
     @staticmethod
     def warning(message, title="Warning", console_only=False):
@@ -54,7 +70,7 @@ class MessageHandler:
         print(f"WARNING: {message}")
         
         if not console_only:
-            messagebox.showwarning(title, message)
+            MessageHandler._show(messagebox.showwarning, "WARNING", title, message)
     
     @staticmethod
     def confirm(message, title="Confirm"):
@@ -71,11 +87,14 @@ class MessageHandler:
         print(f"CONFIRM: {message}")
         return messagebox.askyesno(title, message)
         
-    @staticmethod
-    def confirm_url_open(url, title="Open URL", message=None):
+    @classmethod
+    def confirm_url_open(cls, url, title="Open URL", message=None):
         """
         Display confirmation dialog for opening a URL
         
+        A URL the user has already approved is not asked about again for the
+        rest of the session.
+        
         Args:
             url: The URL to open
             title: The dialog title
@@ -84,8 +103,101 @@ class MessageHandler:
         Returns:
             bool: True if confirmed, False otherwise
         """
+        if cls._url_decisions.get(url):
+            print(f"URL CONFIRMATION: {url} (previously approved)")
+            return True
+            
         if message is None:
             message = f"You are about to open this URL in your web browser:\n\n{url}\n\nWould you like to proceed?"
             
         print(f"URL CONFIRMATION: {url}")
-        return messagebox.askyesno(title, message)
+        confirmed = messagebox.askyesno(title, message)
+        if confirmed:
+            cls._url_decisions[url] = True
+        return confirmed
+    
+    @classmethod
+    def reset_url_cache(cls):
+        """Forget the URLs approved so far so that they are confirmed again"""
+        cls._url_decisions.clear()
+    
+    @classmethod
+    def begin_batch(cls):
+        """
+        Start collecting dialog messages instead of showing them one by one
+        
+        Calls can be nested; the messages are shown when the outermost
+        batch is ended.
+        """
+        cls._batch_depth += 1
+    
+    @classmethod
+    def end_batch(cls, parent=None, title="Messages"):
+        """
+        Stop collecting dialog messages and show everything collected
+        
+        A single message is shown with its usual dialog, several messages are
+        combined into one scrollable window.
+        
+        Args:
+            parent: Parent window for the combined dialog
+            title: Title of the combined dialog
+        """
+        if cls._batch_depth == 0:
+            return
+        cls._batch_depth -= 1
+        if cls._batch_depth:
+            return
+            
+        messages = cls._batched_messages
+        cls._batched_messages = []
+        
+        if len(messages) == 1:
+            show_func, _, msg_title, message = messages[0]
+            show_func(msg_title, message)
+        elif messages:
+            cls._show_batch_dialog(parent, title, messages)
+    
+    @classmethod
+    @contextmanager
+    def batch(cls, parent=None, title="Messages"):
+        """
+        Context manager wrapping begin_batch and end_batch
+        
+        Args:
+            parent: Parent window for the combined dialog
+            title: Title of the combined dialog
+        """
+        cls.begin_batch()
+        try:
+            yield
+        finally:
+            cls.end_batch(parent, title)
+    
+    @staticmethod
+    def _show_batch_dialog(parent, title, messages):
+        """
+        Show several messages in a single modal window
+        
+        Args:
+            parent: Parent window
+            title: The dialog title
+            messages: List of (show function, level, title, message) tuples
+        """
+        dialog = tk.Toplevel(parent)
+        dialog.title(title)
+        dialog.geometry("550x350")
+        if parent is not None:
+            dialog.transient(parent)
+        dialog.grab_set()
+        
+        text = scrolledtext.ScrolledText(dialog, wrap=tk.WORD)
+        text.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 5))
+        text.insert(tk.END, "\n\n".join(
+            f"{level} - {msg_title}:\n{message}" for _, level, msg_title, message in messages
+        ))
+        text.config(state=tk.DISABLED)
+        
+        ttk.Button(dialog, text="OK", command=dialog.destroy).pack(pady=(0, 10))
+        
+        dialog.wait_window()
@@ -4,59 +4,215 @@ Rating System Module
 Handles script ratings using GitHub Issues
 """
 
+import atexit
 import json
 import re
+import functools
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import tkinter as tk
 from tkinter import ttk, messagebox
 import os
 import time
+import threading
+from collections import OrderedDict
 from datetime import datetime
 
+# orjson encodes the ratings cache several times faster; fall back to the
+# standard library when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Title of a rating issue: "Script Rating: [ScriptID] - [RatingValue]/5"
+_RATING_TITLE_RE = re.compile(r'^Script Rating: (.*) - \d+/5$')
+
+# Rating value in an issue title
+_RATING_RE = re.compile(r'(\d+)/5')
+
 class RatingSystem:
     """Manages script ratings using GitHub Issues"""
     
+    # Number of aliased searches sent in a single GraphQL request
+    GRAPHQL_BATCH_SIZE = 100
+    
+    # Bounds of the per-script cache lifetime in seconds. The lifetime doubles
+    # every time a refresh finds the rating unchanged and drops back to the
+    # minimum when it changes.
+    MIN_RATING_TTL = 300
+    MAX_RATING_TTL = 86400
+    
+    # Seconds to wait after a change before writing the cache file, so a burst
+    # of updates results in a single write
+    SAVE_DELAY = 2.0
+    
+    # (connect, read) timeouts for GitHub API requests, so a stalled
+    # connection can't hang a lookup indefinitely
+    REQUEST_TIMEOUT = (3.05, 15)
+    
+    # Number of scripts kept in the ratings cache; the least recently used
+    # are dropped beyond this
+    MAX_CACHED_SCRIPTS = 10000
+    
+    SEARCH_URL = 'https://api.github.com/search/issues'
+    
     def __init__(self, auth_handler, repo_owner="itsmikethetech", repo_name="WinPick-Feedback"):
         self.auth_handler = auth_handler
         self.repo_owner = repo_owner
         self.repo_name = repo_name
-        self.ratings_cache = {}
+        # Guards the cache dicts below, which lookups on several threads read
+        # and change while the save timer snapshots them. Never held during
+        # a network request.
+        self._cache_lock = threading.RLock()
+        # Ordered from least to most recently used
+        self.ratings_cache = OrderedDict()
         self.ratings_cache_time = {}
+        self.ratings_ttl = {}
+        # Rating issues and the ETag from the last search of each script
+        self._issues_cache = {}
+        self.ratings_etag = {}
         self.rating_cache_file = os.path.join(os.path.expanduser("~"), ".winpick", "script_ratings.json")
+        # Time at which the exhausted search rate limit resets (0 if not exhausted)
+        self._search_reset_time = 0
+        self._save_lock = threading.Lock()
+        self._save_timer = None
+        self._dirty = False
+        
+        # Reuse one connection pool for all GitHub API calls instead of
+        # opening a new TLS connection per request
+        self.http = requests.Session()
+        self.http.headers.update({
+            'Accept': 'application/vnd.github.v3+json',
+            'Accept-Encoding': 'gzip',
+            'User-Agent': 'WinPick/1.0'
+        })
+        self.http.mount('https://', HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504],
+                              respect_retry_after_header=True)
+        ))
         
         # Create cache directory if it doesn't exist
         os.makedirs(os.path.dirname(self.rating_cache_file), exist_ok=True)
         
         # Load cached ratings
         self.load_cached_ratings()
+        
+        # Write pending changes when the app exits
+        atexit.register(self._flush)
     
     def load_cached_ratings(self):
         """Load cached ratings from file"""
         try:
             if os.path.exists(self.rating_cache_file):
-                with open(self.rating_cache_file, 'r') as f:
-                    cache_data = json.load(f)
-                    self.ratings_cache = cache_data.get('ratings', {})
+                with open(self.rating_cache_file, 'rb') as f:
+                    raw = f.read()
+                cache_data = orjson.loads(raw) if orjson else json.loads(raw)
+                with self._cache_lock:
+                    self.ratings_cache = OrderedDict(cache_data.get('ratings', {}))
                     self.ratings_cache_time = cache_data.get('cache_time', {})
-                    print(f"Loaded {len(self.ratings_cache)} cached ratings")
+                    self.ratings_ttl = cache_data.get('ttl', {})
+                    self._issues_cache = cache_data.get('issues', {})
+                    self.ratings_etag = cache_data.get('etag', {})
         except Exception as e:
             print(f"Error loading cached ratings: {str(e)}")
-            self.ratings_cache = {}
-            self.ratings_cache_time = {}
+            self.clear_cache()
     
     def save_cached_ratings(self):
         """Save ratings cache to file"""
-        try:
-            with open(self.rating_cache_file, 'w') as f:
-                json.dump({
-                    'ratings': self.ratings_cache,
-                    'cache_time': self.ratings_cache_time
-                }, f)
-                print(f"Saved {len(self.ratings_cache)} ratings to cache")
-        except Exception as e:
-            print(f"Error saving ratings cache: {str(e)}")
+        with self._save_lock:
+            self._dirty = False
+            temp_file = f"{self.rating_cache_file}.tmp"
+            try:
+                # Snapshot the dicts, lookups may still be changing them
+                with self._cache_lock:
+                    cache_data = {
+                        'ratings': dict(self.ratings_cache),
+                        'cache_time': dict(self.ratings_cache_time),
+                        'ttl': dict(self.ratings_ttl),
+                        'issues': dict(self._issues_cache),
+                        'etag': dict(self.ratings_etag)
+                    }
+                if orjson:
+                    data = orjson.dumps(cache_data)
+                else:
+                    data = json.dumps(cache_data, separators=(',', ':')).encode('utf-8')
+                # Write to a temporary file first so a crash can't leave a truncated cache
+                with open(temp_file, 'wb') as f:
+                    f.write(data)
+                os.replace(temp_file, self.rating_cache_file)
+            except Exception as e:
+                print(f"Error saving ratings cache: {str(e)}")
+                # Still unsaved, so the next flush tries again
+                self._dirty = True
+    
+    def _schedule_save(self):
+        """Mark the cache as changed and write it shortly afterwards in the background"""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(self.SAVE_DELAY, self._flush)
+                # Don't hold up exit waiting for the timer, atexit flushes instead
+                self._save_timer.daemon = True
+                self._save_timer.start()
+    
+    def _flush(self):
+        """Write the cache if it changed since the last save"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = None
+            dirty = self._dirty
+        if dirty:
+            self.save_cached_ratings()
+    
+    def clear_cache(self):
+        """Forget every cached rating"""
+        with self._cache_lock:
+            self.ratings_cache = OrderedDict()
+            self.ratings_cache_time = {}
+            self.ratings_ttl = {}
+            self._issues_cache = {}
+            self.ratings_etag = {}
+    
+    def _store_rating(self, script_id, rating_info, now=None):
+        """
+        Cache a freshly fetched rating and adapt how long it stays valid
+        
+        Args:
+            script_id: The script ID from get_script_id
+            rating_info: The latest rating information, or None if there is none
+            now: Fetch time (defaults to the current time)
+        """
+        def issue_number(info):
+            return info['id'] if info else None
+        
+        with self._cache_lock:
+            ttl = self.ratings_ttl.get(script_id, self.MIN_RATING_TTL)
+            if script_id in self.ratings_cache and issue_number(self.ratings_cache[script_id]) == issue_number(rating_info):
+                ttl = min(ttl * 2, self.MAX_RATING_TTL)
+            else:
+                ttl = self.MIN_RATING_TTL
+            
+            self.ratings_cache[script_id] = rating_info
+            self.ratings_cache.move_to_end(script_id)
+            self.ratings_cache_time[script_id] = now if now is not None else time.time()
+            self.ratings_ttl[script_id] = ttl
+            
+            # Drop the least recently used scripts along with their issues and ETags
+            while len(self.ratings_cache) > self.MAX_CACHED_SCRIPTS:
+                old_id, _ = self.ratings_cache.popitem(last=False)
+                self.ratings_cache_time.pop(old_id, None)
+                self.ratings_ttl.pop(old_id, None)
+                self._issues_cache.pop(old_id, None)
+                self.ratings_etag.pop(old_id, None)
     
-    def get_script_id(self, script_path, script_name):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def get_script_id(script_path, script_name):
         """Generate a unique ID for a script based on its path and name"""
         # Create a unique identifier for the script
         script_filename = os.path.basename(script_path)
@@ -76,79 +232,23 @@ class RatingSystem:
         """
         script_id = self.get_script_id(script_path, script_name)
         
-        # Check if we have a cached rating and it's less than 30 minutes old
-        cache_time = self.ratings_cache_time.get(script_id, 0)
-        if not force_refresh and script_id in self.ratings_cache and time.time() - cache_time < 1800:  # 30 minutes
-            return self.ratings_cache[script_id]
+        # Check if we have a cached rating that is still within its lifetime
+        with self._cache_lock:
+            cache_time = self.ratings_cache_time.get(script_id, 0)
+            ttl = self.ratings_ttl.get(script_id, self.MIN_RATING_TTL)
+            if not force_refresh and script_id in self.ratings_cache and time.time() - cache_time < ttl:
+                self.ratings_cache.move_to_end(script_id)
+                return self.ratings_cache[script_id]
         
-        # If not authenticated, return cached rating if available, otherwise None
-        if not self.auth_handler.is_authenticated():
-            return self.ratings_cache.get(script_id)
+        # Only search when authenticated; a successful search also caches the
+        # latest rating, otherwise the previously cached rating is returned
+        if self.auth_handler.is_authenticated():
+            try:
+                self._fetch_issues(script_id, force_refresh)
+            except Exception as e:
+                print(f"Error getting rating: {str(e)}")
         
-        try:
-            # Search for issues with the script ID in the title
-            headers = {
-                'Authorization': f'token {self.auth_handler.token}',
-                'Accept': 'application/vnd.github.v3+json'
-            }
-            
-            # Use the GitHub search API to find issues
-            query = f'repo:{self.repo_owner}/{self.repo_name} in:title "{script_id}" type:issue'
-            response = requests.get(
-                f'https://api.github.com/search/issues?q={query}',
-                headers=headers
-            )
-            
-            if response.status_code != 200:
-                print(f"Error searching for ratings: {response.status_code}")
-                return self.ratings_cache.get(script_id)
-            
-            data = response.json()
-            issues = data.get('items', [])
-            
-            if not issues:
-                # No ratings found
-                self.ratings_cache[script_id] = None
-                self.ratings_cache_time[script_id] = time.time()
-                self.save_cached_ratings()
-                return None
-            
-            # Parse the rating information from the most recent issue
-            latest_issue = issues[0]
-            for issue in issues:
-                if issue['created_at'] > latest_issue['created_at']:
-                    latest_issue = issue
-            
-            title = latest_issue['title']
-            body = latest_issue['body']
-            
-            # Extract the rating value from the title
-            # Format: "Script Rating: [ScriptID] - [RatingValue]/5"
-            rating_match = re.search(r'(\d+)\/5', title)
-            if not rating_match:
-                return None
-            
-            rating_value = int(rating_match.group(1))
-            
-            # Parse the comment and user info
-            rating_info = {
-                'rating': rating_value,
-                'comment': body,
-                'user': latest_issue['user']['login'],
-                'date': latest_issue['created_at'],
-                'url': latest_issue['html_url'],
-                'id': latest_issue['number']
-            }
-            
-            # Cache the rating
-            self.ratings_cache[script_id] = rating_info
-            self.ratings_cache_time[script_id] = time.time()
-            self.save_cached_ratings()
-            
-            return rating_info
-            
-        except Exception as e:
-            print(f"Error getting rating: {str(e)}")
+        with self._cache_lock:
             return self.ratings_cache.get(script_id)
     
     def submit_rating(self, script_path, script_name, rating, comment=""):
@@ -174,11 +274,6 @@ class RatingSystem:
         script_id = self.get_script_id(script_path, script_name)
         
         try:
-            headers = {
-                'Authorization': f'token {self.auth_handler.token}',
-                'Accept': 'application/vnd.github.v3+json'
-            }
-            
             # Create issue title and body
             title = f"Script Rating: {script_id} - {rating}/5"
             
@@ -190,9 +285,9 @@ class RatingSystem:
             body += f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
             
             # Create a new issue in the feedback repository
-            response = requests.post(
+            response = self._request(
+                'POST',
                 f'https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/issues',
-                headers=headers,
                 json={
                     'title': title,
                     'body': body,
@@ -210,15 +305,22 @@ class RatingSystem:
             rating_info = {
                 'rating': rating,
                 'comment': comment,
-                'user': self.auth_handler.user_info['login'],
+                'user': self.auth_handler.get_username(),
                 'date': issue_data['created_at'],
                 'url': issue_data['html_url'],
                 'id': issue_data['number']
             }
             
-            self.ratings_cache[script_id] = rating_info
-            self.ratings_cache_time[script_id] = time.time()
-            self.save_cached_ratings()
+            # Add the new issue to the cached list, newest first, so the
+            # average includes it without waiting for the list to expire.
+            # The list no longer matches the search it was fetched with, so
+            # its ETag goes too.
+            with self._cache_lock:
+                if script_id in self._issues_cache:
+                    self._issues_cache[script_id] = [self._slim_issue(issue_data)] + self._issues_cache[script_id]
+                    self.ratings_etag.pop(script_id, None)
+                self._store_rating(script_id, rating_info)
+            self._schedule_save()
             
             return True
             
@@ -233,54 +335,448 @@ class RatingSystem:
         try:
             # If not authenticated, return None
             if not self.auth_handler.is_authenticated():
-                # Return cached value if available
-                if script_id in self.ratings_cache:
-                    return self.ratings_cache[script_id]['rating']
-                return None
+                return self._cached_rating_value(script_id)
             
-            # Search for all issues with the script ID in the title
-            headers = {
-                'Authorization': f'token {self.auth_handler.token}',
-                'Accept': 'application/vnd.github.v3+json'
-            }
+            return self._fetch_average_rating(script_id)
             
-            # Use the GitHub search API to find issues
-            query = f'repo:{self.repo_owner}/{self.repo_name} in:title "{script_id}" type:issue'
-            response = requests.get(
-                f'https://api.github.com/search/issues?q={query}',
-                headers=headers
-            )
+        except Exception as e:
+            print(f"Error calculating average rating: {str(e)}")
+            return None
+    
+    def get_average_ratings(self, scripts):
+        """
+        Get the average ratings for several scripts at once
+        
+        Ratings come from one GraphQL request per batch of scripts, or from a
+        single search over every rating issue if that fails. When GitHub
+        can't be reached the cached ratings are returned.
+        
+        Args:
+            scripts: Iterable of (script_path, script_name) tuples
+            
+        Returns:
+            dict: Average rating (or None) keyed by (script_path, script_name)
+        """
+        scripts = list(dict.fromkeys(scripts))
+        if not scripts:
+            return {}
+        
+        script_ids = [self.get_script_id(path, name) for path, name in scripts]
+        
+        try:
+            # Check authentication once for the whole batch
+            if not self.auth_handler.is_authenticated():
+                return {script: self._cached_rating_value(script_id)
+                        for script, script_id in zip(scripts, script_ids)}
+            
+            # One GraphQL request per batch of scripts
+            issues_by_id = self.fetch_ratings_bulk(list(dict.fromkeys(script_ids)))
+            if issues_by_id is not None:
+                return {script: self._average_from_issues(issues_by_id.get(script_id))
+                        for script, script_id in zip(scripts, script_ids)}
+            
+            # Fall back to one REST search over every rating issue
+            issues_by_id = self.fetch_all_ratings(script_ids)
+            if issues_by_id is not None:
+                return {script: self._average_from_issues(issues_by_id.get(script_id))
+                        for script, script_id in zip(scripts, script_ids)}
+            
+            # Both searches failed (offline or rate limited), use what is cached
+            with self._cache_lock:
+                return {script: self._average_from_issues(self._issues_cache.get(script_id))
+                        if script_id in self._issues_cache else self._cached_rating_value(script_id)
+                        for script, script_id in zip(scripts, script_ids)}
+            
+        except Exception as e:
+            print(f"Error calculating average ratings: {str(e)}")
+            return {script: None for script in scripts}
+    
+    def _cached_rating_value(self, script_id):
+        """Return the cached rating value for a script, or None"""
+        with self._cache_lock:
+            rating_info = self.ratings_cache.get(script_id)
+        if rating_info:
+            return rating_info['rating']
+        return None
+    
+    def _fetch_average_rating(self, script_id):
+        """
+        Average every rating the feedback repository holds for a script
+        
+        Args:
+            script_id: The script ID from get_script_id
+            
+        Returns:
+            float: Average rating rounded to one decimal, or None if there is none
+        """
+        try:
+            return self._average_from_issues(self._fetch_issues(script_id))
+        except Exception as e:
+            print(f"Error calculating average rating: {str(e)}")
+            return None
+    
+    def _fetch_issues(self, script_id, force_refresh=False):
+        """
+        Get the rating issues for a script, searching GitHub only when needed
+        
+        The issue list is kept for as long as the script's cached rating is
+        valid, so the latest rating and the average share a single search.
+        
+        Args:
+            script_id: The script ID from get_script_id
+            force_refresh: Whether to ignore the cached issues
+            
+        Returns:
+            list: Issues in the REST API format, or None if the search failed
+        """
+        with self._cache_lock:
+            cache_time = self.ratings_cache_time.get(script_id, 0)
+            ttl = self.ratings_ttl.get(script_id, self.MIN_RATING_TTL)
+            cached_issues = self._issues_cache.get(script_id)
+            cached_etag = self.ratings_etag.get(script_id)
+        if not force_refresh and cached_issues is not None and time.time() - cache_time < ttl:
+            return cached_issues
+        
+        # Out of search quota, so don't spend a request on a certain failure
+        if self._search_rate_limited():
+            return cached_issues
+        
+        headers = {}
+        
+        # Revalidate the cached issues instead of downloading them again;
+        # a 304 response carries no body and doesn't use up rate limit
+        if cached_issues is not None and cached_etag:
+            headers['If-None-Match'] = cached_etag
+        
+        # Use the GitHub search API to find issues, following every page so
+        # scripts with more than 100 ratings are averaged over all of them
+        issues = []
+        etag = None
+        for page, response in enumerate(self._search_pages(self._search_query(script_id), headers)):
+            if response.status_code == 304:
+                with self._cache_lock:
+                    # Unchanged, so this also lengthens the rating's lifetime
+                    self._issues_cache[script_id] = cached_issues
+                    self._store_rating(script_id, self.ratings_cache.get(script_id))
+                self._schedule_save()
+                return cached_issues
             
             if response.status_code != 200:
                 print(f"Error searching for ratings: {response.status_code}")
                 return None
             
-            data = response.json()
-            issues = data.get('items', [])
+            # The first page's ETag is what the next search revalidates
+            if page == 0:
+                etag = response.headers.get('ETag')
+            issues.extend(self._slim_issue(issue) for issue in response.json().get('items', []))
+        
+        with self._cache_lock:
+            self._issues_cache[script_id] = issues
+            if etag:
+                self.ratings_etag[script_id] = etag
+            else:
+                self.ratings_etag.pop(script_id, None)
+            self._store_rating(script_id, self._latest_rating_info(issues))
+        self._schedule_save()
+        return issues
+    
+    @staticmethod
+    def _slim_issue(issue):
+        """Keep only the issue fields the rating system uses, so they are cheap to cache"""
+        return {
+            'title': issue['title'],
+            'body': issue['body'],
+            'created_at': issue['created_at'],
+            'html_url': issue['html_url'],
+            'number': issue['number'],
+            'user': {'login': issue['user']['login']}
+        }
+    
+    def _latest_rating_info(self, issues):
+        """
+        Build the rating information of the most recent rating issue
+        
+        Args:
+            issues: Issues in the REST API format
             
-            if not issues:
-                # No ratings found
-                return None
+        Returns:
+            dict: Rating information or None if there is no valid rating
+        """
+        if not issues:
+            return None
+        
+        # Searches return the newest first, but don't rely on the order
+        latest_issue = max(issues, key=lambda issue: issue['created_at'])
+        
+        # Extract the rating value from the title
+        # Format: "Script Rating: [ScriptID] - [RatingValue]/5"
+        rating_match = _RATING_RE.search(latest_issue['title'])
+        if not rating_match:
+            return None
+        
+        return {
+            'rating': int(rating_match.group(1)),
+            'comment': latest_issue['body'],
+            'user': latest_issue['user']['login'],
+            'date': latest_issue['created_at'],
+            'url': latest_issue['html_url'],
+            'id': latest_issue['number']
+        }
+    
+    def _average_from_issues(self, issues):
+        """
+        Average the ratings found in a list of rating issues
+        
+        Args:
+            issues: Issues in the REST API format
             
-            # Extract ratings from all issues
-            all_ratings = []
-            for issue in issues:
-                title = issue['title']
-                rating_match = re.search(r'(\d+)\/5', title)
-                if rating_match:
-                    rating_value = int(rating_match.group(1))
-                    all_ratings.append(rating_value)
+        Returns:
+            float: Average rating rounded to one decimal, or None if there is none
+        """
+        if not issues:
+            # No ratings found
+            return None
+        
+        # Extract ratings from all issues
+        all_ratings = [int(match.group(1))
+                       for match in (_RATING_RE.search(issue['title']) for issue in issues)
+                       if match]
+        
+        if not all_ratings:
+            return None
+        
+        # Calculate the average rating
+        average_rating = sum(all_ratings) / len(all_ratings)
+        return round(average_rating, 1)
+    
+    def fetch_ratings_bulk(self, script_ids):
+        """
+        Fetch the rating issues for many scripts with GraphQL search queries
+        
+        Each request carries one aliased search per script, so N scripts need
+        ceil(N / GRAPHQL_BATCH_SIZE) requests instead of N REST searches.
+        The latest rating of every script is stored in the ratings cache.
+        A search returns at most 100 issues, so scripts with more ratings
+        than that are fetched again with the paginated REST search.
+        
+        Args:
+            script_ids: List of script IDs from get_script_id
             
-            if not all_ratings:
-                return None
+        Returns:
+            dict: Issues in the REST API format keyed by script ID,
+                  or None if the query failed
+        """
+        fields = "pageInfo { hasNextPage } nodes { ... on Issue { title body createdAt url number author { login } } }"
+        results = {}
+        # Scripts whose ratings didn't fit in a single search
+        overflow = set()
+        
+        try:
+            for start in range(0, len(script_ids), self.GRAPHQL_BATCH_SIZE):
+                batch = script_ids[start:start + self.GRAPHQL_BATCH_SIZE]
+                # GraphQL search has no sort argument, so the order goes in the query
+                searches = "\n".join(
+                    f's{i}: search(query: {json.dumps(self._search_query(script_id) + " sort:created-desc")}, type: ISSUE, first: 100) {{ {fields} }}'
+                    for i, script_id in enumerate(batch)
+                )
+                response = self._request(
+                    'POST',
+                    'https://api.github.com/graphql',
+                    json={'query': f'query {{\n{searches}\n}}'}
+                )
+                
+                if response.status_code != 200:
+                    print(f"Error searching for ratings: {response.status_code}")
+                    return None
+                
+                data = response.json()
+                if data.get('errors') or not data.get('data'):
+                    print(f"Error searching for ratings: {data.get('errors')}")
+                    return None
+                
+                for i, script_id in enumerate(batch):
+                    search = data['data'].get(f's{i}') or {}
+                    if (search.get('pageInfo') or {}).get('hasNextPage'):
+                        overflow.add(script_id)
+                    nodes = search.get('nodes', [])
+                    # Convert to the REST format used everywhere else
+                    results[script_id] = [{
+                        'title': node['title'],
+                        'body': node['body'],
+                        'created_at': node['createdAt'],
+                        'html_url': node['url'],
+                        'number': node['number'],
+                        'user': {'login': (node.get('author') or {}).get('login', 'ghost')}
+                    } for node in nodes if node]
             
-            # Calculate the average rating
-            average_rating = sum(all_ratings) / len(all_ratings)
-            return round(average_rating, 1)
+        except Exception as e:
+            print(f"Error searching for ratings: {str(e)}")
+            return None
+        
+        self._store_bulk_results({script_id: issues for script_id, issues in results.items()
+                                  if script_id not in overflow})
+        
+        # The REST search follows every page and caches the complete list;
+        # if it fails the first 100 ratings are still returned
+        for script_id in overflow:
+            issues = self._fetch_issues(script_id, force_refresh=True)
+            if issues is not None:
+                results[script_id] = issues
+        return results
+    
+    def fetch_all_ratings(self, script_ids):
+        """
+        Fetch the rating issues for many scripts with a single REST search
+        
+        Every rating issue carries the script-rating label, so one search
+        (100 issues per page) returns the ratings of all scripts, which are
+        then grouped by the script ID in their titles.
+        
+        The search API returns at most 1000 results, newest first. When
+        there are more, a script with no match may only have older ratings,
+        so its cached issues are kept instead of being replaced.
+        
+        Args:
+            script_ids: List of script IDs from get_script_id
+            
+        Returns:
+            dict: Issues in the REST API format keyed by script ID,
+                  or None if the search failed
+        """
+        query = f'repo:{self.repo_owner}/{self.repo_name} label:script-rating type:issue'
+        results = {script_id: [] for script_id in script_ids}
+        truncated = False
+        
+        if self._search_rate_limited():
+            print("Warning: GitHub search rate limit reached, using cached ratings")
+            return None
+        
+        try:
+            for response in self._search_pages(query):
+                if response.status_code in (403, 429):
+                    retry_after = response.headers.get('Retry-After') or response.headers.get('X-RateLimit-Reset')
+                    print(f"Warning: GitHub rate limit reached, using cached ratings (retry after: {retry_after})")
+                    return None
+                
+                if response.status_code != 200:
+                    print(f"Error searching for ratings: {response.status_code}")
+                    return None
+                
+                data = response.json()
+                if data.get('incomplete_results') or data.get('total_count', 0) > 1000:
+                    truncated = True
+                for issue in data.get('items', []):
+                    title_match = _RATING_TITLE_RE.match(issue['title'])
+                    if title_match and title_match.group(1) in results:
+                        results[title_match.group(1)].append(self._slim_issue(issue))
             
         except Exception as e:
-            print(f"Error calculating average rating: {str(e)}")
+            print(f"Error searching for ratings: {str(e)}")
             return None
+        
+        if truncated:
+            # Only the scripts that matched are known to be current
+            results = {script_id: issues for script_id, issues in results.items() if issues}
+        self._store_bulk_results(results)
+        
+        with self._cache_lock:
+            for script_id in script_ids:
+                if script_id not in results and script_id in self._issues_cache:
+                    results[script_id] = self._issues_cache[script_id]
+        return results
+    
+    def _search_pages(self, query, headers=None):
+        """
+        Run an issue search and yield its responses one page at a time
+        
+        Results are sorted newest first. Pages of 100 issues are followed
+        through the Link header until the last one, or until a response
+        isn't successful. The search API stops at 1000 results, so there are
+        at most 10 pages.
+        
+        Args:
+            query: GitHub issue search query
+            headers: Extra headers for the first request
+            
+        Yields:
+            requests.Response: Each page's response
+        """
+        response = self._request(
+            'GET',
+            self.SEARCH_URL,
+            params={'q': query, 'sort': 'created', 'order': 'desc', 'per_page': 100},
+            headers=headers
+        )
+        while True:
+            yield response
+            next_page = response.links.get('next') if response.status_code == 200 else None
+            if not next_page:
+                return
+            # The next URL already carries the query and page number
+            response = self._request('GET', next_page['url'])
+    
+    def _request(self, method, url, headers=None, **kwargs):
+        """
+        Send an authenticated GitHub API request over the shared session
+        
+        Adds the token and the default timeout, and records the search rate
+        limit from search responses.
+        
+        Args:
+            method: HTTP method
+            url: API URL
+            headers: Extra request headers
+            **kwargs: Passed on to requests.Session.request
+            
+        Returns:
+            requests.Response: The response
+        """
+        request_headers = {'Authorization': f'token {self.auth_handler.token}'}
+        if headers:
+            request_headers.update(headers)
+        kwargs.setdefault('timeout', self.REQUEST_TIMEOUT)
+        
+        response = self.http.request(method, url, headers=request_headers, **kwargs)
+        if url.startswith(self.SEARCH_URL):
+            self._track_search_rate_limit(response)
+        return response
+    
+    def _track_search_rate_limit(self, response):
+        """
+        Remember when the search rate limit resets once a response shows it is used up
+        
+        Args:
+            response: Response from the GitHub search API
+        """
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining == '0' and reset and reset.isdigit():
+            self._search_reset_time = int(reset)
+        elif remaining and remaining != '0':
+            self._search_reset_time = 0
+    
+    def _search_rate_limited(self):
+        """Check whether the search rate limit is used up until its reset time"""
+        return time.time() < self._search_reset_time
+    
+    def _store_bulk_results(self, results):
+        """
+        Cache the issues and latest rating of every script with a single write
+        
+        Args:
+            results: Issues in the REST API format keyed by script ID
+        """
+        now = time.time()
+        with self._cache_lock:
+            for script_id, issues in results.items():
+                self._issues_cache[script_id] = issues
+                self.ratings_etag.pop(script_id, None)
+                self._store_rating(script_id, self._latest_rating_info(issues), now)
+        self._schedule_save()
+    
+    def _search_query(self, script_id):
+        """Build the GitHub issue search query for a script's ratings"""
+        return f'repo:{self.repo_owner}/{self.repo_name} in:title "{script_id}" type:issue'
     
     def show_rating_dialog(self, parent, script_info):
         """
@@ -353,10 +849,6 @@ class RatingSystem:
         script_path = script_info['path']
         script_name = script_info['name']
         
-        # Get existing rating
-        rating_info = self.get_rating(script_path, script_name)
-        average_rating = self.get_average_rating(script_path, script_name)
-        
         # Create the dialog
         dialog = tk.Toplevel(parent)
         dialog.title(f"Rate Script: {script_name}")
@@ -402,43 +894,33 @@ class RatingSystem:
             font=("Segoe UI", 10)
         ).pack(anchor=tk.W, pady=(5, 0))
         
-        # Display average rating if available
-        if average_rating is not None:
-            avg_frame = ttk.Frame(main_frame)
-            avg_frame.pack(fill=tk.X, pady=(0, 15))
-            
-            ttk.Label(
-                avg_frame,
-                text="Average Rating:",
-                font=("Segoe UI", 12, "bold")
-            ).grid(row=0, column=0, sticky=tk.W)
-            
-            # Create star display for average rating
-            stars_frame = ttk.Frame(avg_frame)
-            stars_frame.grid(row=0, column=1, padx=(10, 0))
-            
-            # Display star characters based on rating (★ for filled, ☆ for empty)
-            full_stars = int(average_rating)
-            half_star = average_rating - full_stars >= 0.5
-            empty_stars = 5 - full_stars - (1 if half_star else 0)
-            
-            star_text = "★" * full_stars
-            if half_star:
-                star_text += "½"
-            star_text += "☆" * empty_stars
-            
-            ttk.Label(
-                stars_frame,
-                text=star_text,
-                font=("Segoe UI", 14),
-                foreground="#FFD700"  # Gold color for stars
-            ).pack(side=tk.LEFT)
-            
-            ttk.Label(
-                stars_frame,
-                text=f" ({average_rating}/5)",
-                font=("Segoe UI", 12)
-            ).pack(side=tk.LEFT)
+        # Average rating, filled in once the ratings have loaded
+        avg_frame = ttk.Frame(main_frame)
+        avg_frame.pack(fill=tk.X, pady=(0, 15))
+        
+        ttk.Label(
+            avg_frame,
+            text="Average Rating:",
+            font=("Segoe UI", 12, "bold")
+        ).grid(row=0, column=0, sticky=tk.W)
+        
+        stars_frame = ttk.Frame(avg_frame)
+        stars_frame.grid(row=0, column=1, padx=(10, 0))
+        
+        avg_stars_label = ttk.Label(
+            stars_frame,
+            text="",
+            font=("Segoe UI", 14),
+            foreground="#FFD700"  # Gold color for stars
+        )
+        avg_stars_label.pack(side=tk.LEFT)
+        
+        avg_value_label = ttk.Label(
+            stars_frame,
+            text="Loading...",
+            font=("Segoe UI", 12)
+        )
+        avg_value_label.pack(side=tk.LEFT)
         
         # Separator
         ttk.Separator(main_frame).pack(fill=tk.X, pady=10)
@@ -454,7 +936,7 @@ class RatingSystem:
         ).grid(row=0, column=0, sticky=tk.W)
         
         # Rating variable
-        current_rating = tk.IntVar(value=rating_info['rating'] if rating_info else 0)
+        current_rating = tk.IntVar(value=0)
         
         # Star buttons for rating
         stars_frame = ttk.Frame(rating_frame)
@@ -500,9 +982,47 @@ class RatingSystem:
         comment_text = tk.Text(comment_frame, height=5, width=50, wrap=tk.WORD)
         comment_text.pack(fill=tk.X, pady=(5, 0))
         
-        # Set existing comment if available
-        if rating_info and rating_info.get('comment'):
-            comment_text.insert('1.0', rating_info['comment'])
+        def fill_ratings(rating_info, average_rating):
+            if not dialog.winfo_exists():
+                return
+            
+            # Display star characters based on rating (★ for filled, ☆ for empty)
+            if average_rating is not None:
+                full_stars = int(average_rating)
+                half_star = average_rating - full_stars >= 0.5
+                empty_stars = 5 - full_stars - (1 if half_star else 0)
+                
+                star_text = "★" * full_stars
+                if half_star:
+                    star_text += "½"
+                star_text += "☆" * empty_stars
+                
+                avg_stars_label.configure(text=star_text)
+                avg_value_label.configure(text=f" ({average_rating}/5)")
+            else:
+                avg_frame.pack_forget()
+            
+            # Prefill the existing rating unless the user has already started
+            if rating_info and current_rating.get() == 0:
+                current_rating.set(rating_info['rating'])
+                update_star_buttons()
+            
+            # Set existing comment if available
+            if rating_info and rating_info.get('comment') and not comment_text.get('1.0', tk.END).strip():
+                comment_text.insert('1.0', rating_info['comment'])
+        
+        def load_ratings():
+            # Get existing rating; the average reuses the same search
+            rating_info = self.get_rating(script_path, script_name)
+            average_rating = self.get_average_rating(script_path, script_name)
+            try:
+                dialog.after(0, fill_ratings, rating_info, average_rating)
+            except (RuntimeError, tk.TclError):
+                # The dialog was closed while loading
+                pass
+        
+        # Load the ratings in the background so the dialog appears immediately
+        threading.Thread(target=load_ratings, daemon=True).start()
         
         # Buttons
         buttons_frame = ttk.Frame(main_frame)
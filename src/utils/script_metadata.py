@@ -5,6 +5,156 @@ Functions for parsing script metadata from files
 
 import os
 import re
+import json
+import threading
+import ctypes
+from ctypes import wintypes
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# File extensions recognised as scripts
+SCRIPT_EXTENSIONS = frozenset({'.ps1', '.py', '.bat', '.cmd', '.exe'})
+
+# Script extensions that use "::" comments
+_BATCH_EXTENSIONS = frozenset({'.bat', '.cmd'})
+
+# Metadata keys, in the order parse_script_metadata returns them
+_METADATA_KEYS = ('NAME', 'DESCRIPTION', 'UNDOABLE', 'UNDO_DESC', 'DEVELOPER', 'LINK')
+
+# A single pattern per comment style matches every metadata key, so the
+# content is scanned once; batch files use "::" comments and everything
+# else uses "#". The patterns work on the raw bytes so only the captured
+# values need decoding.
+_KEY_ALTERNATION = '|'.join(_METADATA_KEYS).encode('ascii')
+_BATCH_PATTERN = re.compile(rb'::[ \t]*(' + _KEY_ALTERNATION + rb'):[ \t]*(.*?)[\r\n]', re.IGNORECASE)
+_HASH_PATTERN = re.compile(rb'#[ \t]*(' + _KEY_ALTERNATION + rb'):[ \t]*(.*?)[\r\n]', re.IGNORECASE)
+
+# Parsed metadata keyed by script path, stored as [mtime_ns, size, metadata]
+# so a file is only read again after it changes. Entries are kept in least
+# recently used order and the oldest are dropped beyond _META_CACHE_SIZE.
+_META_CACHE = OrderedDict()
+_META_CACHE_SIZE = 4096
+_META_CACHE_LOCK = threading.Lock()
+_META_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".winpick", "cache", "metadata_cache.json")
+
+def list_script_files(directory):
+    """
+    List the script files directly inside a directory
+    
+    A single os.scandir pass supplies each entry's name and type, so only
+    entries with a script extension need a file check. Hidden files and
+    editor backups ("~" suffix) are skipped by name.
+    
+    Args:
+        directory: The directory to list
+        
+    Returns:
+        list: (script type, file path) tuples, the type being the upper-case
+              extension without the dot (e.g. "PS1")
+    """
+    script_files = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            # Hidden files and editor backups are never scripts
+            if name.startswith('.') or name.endswith('~'):
+                continue
+            ext = os.path.splitext(name)[1].lower()
+            if ext in SCRIPT_EXTENSIONS and entry.is_file():
+                script_files.append((ext[1:].upper(), entry.path))
+    return script_files
+
+def load_metadata_cache():
+    """Load the metadata cache saved by a previous session"""
+    try:
+        if os.path.exists(_META_CACHE_FILE):
+            with open(_META_CACHE_FILE, 'r') as f:
+                for script_path, entry in json.load(f).items():
+                    _cache_put(script_path, entry)
+    except Exception as e:
+        print(f"Warning: Failed to read metadata cache: {str(e)}")
+
+def save_metadata_cache():
+    """Save the metadata cache so the next session can reuse it"""
+    try:
+        os.makedirs(os.path.dirname(_META_CACHE_FILE), exist_ok=True)
+        with _META_CACHE_LOCK:
+            snapshot = dict(_META_CACHE)
+        # Write to a temporary file first so a crash can't leave a truncated cache
+        temp_file = f"{_META_CACHE_FILE}.tmp"
+        with open(temp_file, 'w') as f:
+            json.dump(snapshot, f)
+        os.replace(temp_file, _META_CACHE_FILE)
+    except Exception as e:
+        print(f"Warning: Failed to save metadata cache: {str(e)}")
+
+def _cache_get(script_path):
+    """Look up a metadata cache entry and mark it as recently used"""
+    with _META_CACHE_LOCK:
+        entry = _META_CACHE.get(script_path)
+        if entry is not None:
+            _META_CACHE.move_to_end(script_path)
+        return entry
+
+def _cache_put(script_path, entry):
+    """Store a metadata cache entry, dropping the least recently used beyond the limit"""
+    with _META_CACHE_LOCK:
+        _META_CACHE[script_path] = entry
+        _META_CACHE.move_to_end(script_path)
+        while len(_META_CACHE) > _META_CACHE_SIZE:
+            _META_CACHE.popitem(last=False)
+
+# version.dll prototypes, resolved once at import (None when not on Windows)
+try:
+    _version = ctypes.windll.version
+    _GetFileVersionInfoSizeW = ctypes.WINFUNCTYPE(
+        wintypes.DWORD, wintypes.LPCWSTR, ctypes.POINTER(wintypes.DWORD)
+    )(("GetFileVersionInfoSizeW", _version))
+    _GetFileVersionInfoW = ctypes.WINFUNCTYPE(
+        wintypes.BOOL, wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, ctypes.c_void_p
+    )(("GetFileVersionInfoW", _version))
+    _VerQueryValueW = ctypes.WINFUNCTYPE(
+        wintypes.BOOL, ctypes.c_void_p, wintypes.LPCWSTR,
+        ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(wintypes.UINT)
+    )(("VerQueryValueW", _version))
+except AttributeError:
+    _GetFileVersionInfoSizeW = _GetFileVersionInfoW = _VerQueryValueW = None
+
+def _read_version_strings(exe_path, names):
+    """
+    Read StringFileInfo values from an executable's version resource
+    
+    The version resource is loaded once and every value is then looked up
+    in memory with VerQueryValueW.
+    
+    Args:
+        exe_path: Path to the executable
+        names: StringFileInfo names to look up (e.g. "FileDescription")
+        
+    Returns:
+        dict: Non-empty values keyed by name
+    """
+    size = _GetFileVersionInfoSizeW(exe_path, None)
+    if not size:
+        return {}
+    buffer = ctypes.create_string_buffer(size)
+    if not _GetFileVersionInfoW(exe_path, 0, size, buffer):
+        return {}
+    
+    value = ctypes.c_void_p()
+    length = wintypes.UINT()
+    if not _VerQueryValueW(buffer, '\\VarFileInfo\\Translation', ctypes.byref(value), ctypes.byref(length)) or length.value < 4:
+        return {}
+    lang, codepage = ctypes.cast(value, ctypes.POINTER(wintypes.WORD))[0:2]
+    
+    strings = {}
+    for name in names:
+        str_info_path = f'\\StringFileInfo\\{lang:04x}{codepage:04x}\\{name}'
+        if _VerQueryValueW(buffer, str_info_path, ctypes.byref(value), ctypes.byref(length)) and length.value:
+            text = ctypes.wstring_at(value.value, length.value).rstrip('\0')
+            if text:
+                strings[name] = text
+    return strings
 
 def get_exe_metadata(exe_path):
     """Extract metadata from an EXE file"""
@@ -12,27 +162,16 @@ def get_exe_metadata(exe_path):
         name = os.path.basename(exe_path)
         description = "Executable file"
         
-        try:
-            import win32api
+        if _GetFileVersionInfoW is None:
+            name = os.path.splitext(os.path.basename(exe_path))[0]
+            description = "Windows Executable"
+        else:
             try:
-                info = win32api.GetFileVersionInfo(exe_path, '\\')
-                ms = info['FileVersionMS']
-                ls = info['FileVersionLS']
-                version = f"{win32api.HIWORD(ms)}.{win32api.LOWORD(ms)}.{win32api.HIWORD(ls)}.{win32api.LOWORD(ls)}"
-                lang, codepage = win32api.GetFileVersionInfo(exe_path, '\\VarFileInfo\\Translation')[0]
-                str_info_path = f'\\StringFileInfo\\{lang:04x}{codepage:04x}\\FileDescription'
-                description_info = win32api.GetFileVersionInfo(exe_path, str_info_path)
-                if description_info:
-                    description = description_info
-                str_info_path = f'\\StringFileInfo\\{lang:04x}{codepage:04x}\\ProductName'
-                name_info = win32api.GetFileVersionInfo(exe_path, str_info_path)
-                if name_info:
-                    name = name_info
+                strings = _read_version_strings(exe_path, ('FileDescription', 'ProductName'))
+                description = strings.get('FileDescription', description)
+                name = strings.get('ProductName', name)
             except:
                 pass
-        except ImportError:
-            name = os.path.splitext(os.path.basename(exe_path))[0]
-            description = "Windows Executable"
         
         return name, description, "No", "", "", ""
         
@@ -60,53 +199,80 @@ def parse_script_metadata(script_path):
     default_link = ""
     
     try:
+        # Reuse the previous result if the file hasn't changed since
+        st = os.stat(script_path)
+        cached = _cache_get(script_path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return tuple(cached[2])
+        
         _, ext = os.path.splitext(script_path)
         ext = ext.lower()
         
         if ext == '.exe':
-            return get_exe_metadata(script_path)
-        
-        with open(script_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read(2000)
+            metadata = get_exe_metadata(script_path)
+            _cache_put(script_path, [st.st_mtime_ns, st.st_size, list(metadata)])
+            return metadata
         
-        if ext in ['.bat', '.cmd']:
-            name_pattern = r'(?i)::[ \t]*NAME:[ \t]*(.*?)[\r\n]'
-            desc_pattern = r'(?i)::[ \t]*DESCRIPTION:[ \t]*(.*?)[\r\n]'
-            undoable_pattern = r'(?i)::[ \t]*UNDOABLE:[ \t]*(.*?)[\r\n]'
-            undo_desc_pattern = r'(?i)::[ \t]*UNDO_DESC:[ \t]*(.*?)[\r\n]'
-            developer_pattern = r'(?i)::[ \t]*DEVELOPER:[ \t]*(.*?)[\r\n]'
-            link_pattern = r'(?i)::[ \t]*LINK:[ \t]*(.*?)[\r\n]'
-        else:
-            name_pattern = r'(?i)#[ \t]*NAME:[ \t]*(.*?)[\r\n]'
-            desc_pattern = r'(?i)#[ \t]*DESCRIPTION:[ \t]*(.*?)[\r\n]'
-            undoable_pattern = r'(?i)#[ \t]*UNDOABLE:[ \t]*(.*?)[\r\n]'
-            undo_desc_pattern = r'(?i)#[ \t]*UNDO_DESC:[ \t]*(.*?)[\r\n]'
-            developer_pattern = r'(?i)#[ \t]*DEVELOPER:[ \t]*(.*?)[\r\n]'
-            link_pattern = r'(?i)#[ \t]*LINK:[ \t]*(.*?)[\r\n]'
+        pattern = _BATCH_PATTERN if ext in _BATCH_EXTENSIONS else _HASH_PATTERN
         
-        name_match = re.search(name_pattern, content)
-        friendly_name = name_match.group(1).strip() if name_match else default_name
+        # Metadata lives in the header, so read line by line within the first
+        # 2000 bytes and stop as soon as every key has been found.
+        # The first occurrence of each key wins.
+        metadata = {}
+        with open(script_path, 'rb') as f:
+            remaining = 2000
+            while remaining > 0 and len(metadata) < len(_METADATA_KEYS):
+                line = f.readline(remaining)
+                if not line:
+                    break
+                remaining -= len(line)
+                for match in pattern.finditer(line):
+                    key = match.group(1).decode('ascii').upper()
+                    if key not in metadata:
+                        metadata[key] = match.group(2).decode('utf-8', errors='ignore').strip()
         
-        desc_match = re.search(desc_pattern, content)
-        description = desc_match.group(1).strip() if desc_match else default_description
+        friendly_name = metadata.get('NAME', default_name)
+        description = metadata.get('DESCRIPTION', default_description)
         
-        undoable_match = re.search(undoable_pattern, content)
-        if undoable_match:
-            undoable_value = undoable_match.group(1).strip().lower()
-            undoable = "Yes" if undoable_value in ['yes', 'true', '1'] else "No"
+        if 'UNDOABLE' in metadata:
+            undoable = "Yes" if metadata['UNDOABLE'].lower() in ['yes', 'true', '1'] else "No"
         else:
             undoable = default_undoable
         
-        undo_desc_match = re.search(undo_desc_pattern, content)
-        undo_desc = undo_desc_match.group(1).strip() if undo_desc_match else default_undo_desc
+        undo_desc = metadata.get('UNDO_DESC', default_undo_desc)
+        developer = metadata.get('DEVELOPER', default_developer)
+        link = metadata.get('LINK', default_link)
         
-        developer_match = re.search(developer_pattern, content)
-        developer = developer_match.group(1).strip() if developer_match else default_developer
-        
-        link_match = re.search(link_pattern, content)
-        link = link_match.group(1).strip() if link_match else default_link
-        
-        return friendly_name, description, undoable, undo_desc, developer, link
+        metadata = (friendly_name, description, undoable, undo_desc, developer, link)
+        _cache_put(script_path, [st.st_mtime_ns, st.st_size, list(metadata)])
+        return metadata
     except Exception as e:
         print(f"Error parsing metadata for {script_path}: {str(e)}")
-        return default_name, f"Error reading metadata: {str(e)}", default_undoable, default_undo_desc, default_developer, default_link
\ No newline at end of file
+        return default_name, f"Error reading metadata: {str(e)}", default_undoable, default_undo_desc, default_developer, default_link
+
+# Thread pool shared by every parse_metadata_batch call, created on first use
+_executor = None
+
+def parse_metadata_batch(script_paths):
+    """
+    Parse the metadata of several scripts concurrently
+    
+    Parsing is dominated by file I/O, so a thread pool overlaps the reads.
+    
+    Args:
+        script_paths: List of script file paths
+        
+    Returns:
+        list: The parse_script_metadata result of each path, in input order
+    """
+    global _executor
+    
+    if len(script_paths) < 2:
+        return [parse_script_metadata(path) for path in script_paths]
+    
+    # Keep the worker threads between batches rather than starting new
+    # ones every time a category is opened
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4),
+                                       thread_name_prefix="metadata")
+    return list(_executor.map(parse_script_metadata, script_paths))
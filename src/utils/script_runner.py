@@ -7,6 +7,45 @@ import os
 import sys
 import subprocess
 import ctypes
+from ctypes import wintypes
+
+# Private ShellExecuteW prototype, resolved once at import (None when not on
+# Windows). Its own function object leaves the shared
+# ctypes.windll.shell32.ShellExecuteW, used by admin_utils, unchanged.
+try:
+    _ShellExecuteW = ctypes.WINFUNCTYPE(
+        wintypes.HINSTANCE, wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR,
+        wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_int
+    )(("ShellExecuteW", ctypes.windll.shell32))
+except AttributeError:
+    _ShellExecuteW = None
+
+def _exe_command(script_path, undo):
+    """EXE files are executed directly and have no undo mode"""
+    if undo:
+        print("\nWARNING: Undo operation not supported for EXE files\n")
+        raise ValueError("Undo operation not supported for EXE files")
+    return [script_path]
+
+def _batch_command(script_path, undo):
+    """
+    Batch files are handed to cmd.exe as a single command line
+    
+    cmd /c drops the first and last quote of its command when it contains
+    characters such as & or (), so the quoted path gets an extra outer pair
+    of quotes; passing a list would quote only the path.
+    """
+    return f'cmd.exe /c ""{script_path}"{" undo" if undo else ""}"'
+
+# Command builders keyed by script extension, each taking (script_path, undo);
+# batch files are handed to cmd.exe explicitly instead of going through shell=True
+_RUNNERS = {
+    '.ps1': lambda path, undo: ["powershell", "-ExecutionPolicy", "Bypass", "-File", path] + (["-Undo"] if undo else []),
+    '.py': lambda path, undo: [sys.executable, path] + (["--undo"] if undo else []),
+    '.bat': _batch_command,
+    '.cmd': _batch_command,
+    '.exe': _exe_command,
+}
 
 def run_script(script_path, undo=False):
     """Run the script and return the process object"""
@@ -14,38 +53,10 @@ def run_script(script_path, undo=False):
     _, ext = os.path.splitext(script_path)
     ext = ext.lower()
     
-    # Different handling based on script type
-    if ext == '.ps1':
-        if undo:
-            cmd = ["powershell", "-ExecutionPolicy", "Bypass", "-File", script_path, "-Undo"]
-        else:
-            cmd = ["powershell", "-ExecutionPolicy", "Bypass", "-File", script_path]
-    elif ext == '.py':
-        if undo:
-            cmd = [sys.executable, script_path, "--undo"]
-        else:
-            cmd = [sys.executable, script_path]
-    elif ext in ['.bat', '.cmd']:
-        if undo:
-            cmd = [script_path, "undo"]
-        else:
-            cmd = [script_path]
-        return subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            shell=True,
-            creationflags=subprocess.CREATE_NO_WINDOW
-        )
-    elif ext == '.exe':
-        # For EXE files, simply execute them directly
-        if undo:
-            print("\nWARNING: Undo operation not supported for EXE files\n")
-            raise ValueError("Undo operation not supported for EXE files")
-        cmd = [script_path]
-    else:
+    build_command = _RUNNERS.get(ext)
+    if build_command is None:
         raise ValueError(f"Unsupported script type: {ext}")
+    cmd = build_command(script_path, undo)
     
     # Create and return the process
     return subprocess.Popen(
@@ -71,39 +82,37 @@ def run_script_as_admin(script_path, undo=False):
                 args = f"-ExecutionPolicy Bypass -File \"{script_path}\" -Undo"
             else:
                 args = f"-ExecutionPolicy Bypass -File \"{script_path}\""
-            
-            ctypes.windll.shell32.ShellExecuteW(
-                None, "runas", "powershell", args, None, 1
-            )
+            program = "powershell"
         elif ext == '.py':
             if undo:
                 args = f"\"{script_path}\" --undo"
             else:
                 args = f"\"{script_path}\""
-            
-            ctypes.windll.shell32.ShellExecuteW(
-                None, "runas", sys.executable, args, None, 1
-            )
+            program = sys.executable
         elif ext in ['.bat', '.cmd']:
             if undo:
                 args = "undo"
             else:
                 args = None
-            
-            ctypes.windll.shell32.ShellExecuteW(
-                None, "runas", script_path, args, None, 1
-            )
+            program = script_path
         elif ext == '.exe':
             if undo:
                 print("\nWARNING: Undo operation not supported for EXE files\n")
                 return False
-            
-            ctypes.windll.shell32.ShellExecuteW(
-                None, "runas", script_path, None, None, 1
-            )
+            args = None
+            program = script_path
         else:
             raise ValueError(f"Unsupported script type: {ext}")
         
+        if _ShellExecuteW is None:
+            raise OSError("ShellExecuteW is only available on Windows")
+        
+        # ShellExecuteW returns a value greater than 32 on success
+        result = _ShellExecuteW(None, "runas", program, args, None, 1)
+        if (result or 0) <= 32:
+            print(f"\nERROR: Failed to run script as Administrator (ShellExecuteW error {result or 0})\n")
+            return False
+        
         return True
     except Exception as e:
         print(f"\nERROR: Failed to run script as Administrator: {str(e)}\n")